@@ -0,0 +1,61 @@
+import argparse
+import os
+import random
+
+from common import main_module, measure, report
+
+TAGS = ["RPG", "Ação", "Aventura", "Terror", "Corrida", "Esporte", "Estratégia", "Indie", "Luta", "Simulação",
+        "top", "novo"]
+
+
+def build_catalog(games):
+    catalog = {}
+    for i in range(games):
+        name = f"Jogo Sintético {i:05d}"
+        catalog[name.lower().replace(" ", "_")] = {
+            "nome": name,
+            "link": f"https://example.com/download/{i}",
+            "tags": random.sample(TAGS, random.randint(1, 4)),
+            "descricao": "Roda bem no Winlator com DXVK e Box64. " * random.randint(1, 5),
+            "imagem": f"https://example.com/capa/{i}.jpg",
+            "adicionado_por": f"user{i % 500}",
+            "data": "01/01/2024 12:00"
+        }
+    return catalog
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=50000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    
+    random.seed(13)
+    with main_module() as main:
+        db = main.db
+        catalog = build_catalog(args.games)
+        last_update = "01/01/2024 12:00"
+        json_data = {"games": list(catalog.values()), "keys": list(catalog.keys()), "last_update": last_update}
+        
+        def save_json():
+            db.writer.write_json(db.games_cache_file, json_data)
+            db.writer.flush()
+        
+        def save_binary():
+            db.writer.write_bytes(db.games_cache_bin_file, db._encode_catalog(catalog, last_update))
+            db.writer.flush()
+        
+        print(f"Cache de {args.games} jogos, {args.rounds} rodadas")
+        report("JSON: salvar", measure(save_json, args.rounds))
+        report("binário: salvar", measure(save_binary, args.rounds))
+        report("JSON: carregar", measure(db._get_cached_catalog_json, args.rounds))
+        report("binário: carregar", measure(lambda: db._decode_catalog(db.writer.read_bytes(db.games_cache_bin_file)), args.rounds))
+        
+        assert db._get_cached_catalog_json() == catalog
+        assert db._decode_catalog(db.writer.read_bytes(db.games_cache_bin_file)) == catalog
+        print(f"{'JSON: tamanho':<40} {os.path.getsize(db.games_cache_file) / 1024:10.0f} KiB")
+        print(f"{'binário: tamanho':<40} {os.path.getsize(db.games_cache_bin_file) / 1024:10.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
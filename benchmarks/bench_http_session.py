@@ -0,0 +1,53 @@
+import argparse
+
+import requests
+
+from common import main_module, measure, report
+from firebase_stub import FirebaseStub
+
+
+def build_root(games):
+    catalog = {}
+    comments = {}
+    for i in range(games):
+        game_id = f"game_{i:04d}"
+        catalog[game_id] = {"nome": f"Game {i:04d}", "link": f"http://example.com/{i}", "tags": ["RPG"]}
+        comments[game_id] = {f"-N{i:013d}": {"user": "bench", "text": "ok", "date": "01/01/2024 12:00"}}
+    return {"games": catalog, "comments": comments}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    
+    stub = FirebaseStub().start()
+    stub.root = build_root(args.games)
+    try:
+        with main_module() as main:
+            main.FIREBASE_URL = stub.url
+            db = main.db
+            game_ids = sorted(stub.root["games"])
+            calls = len(game_ids) + 1
+            
+            def refresh_per_call():
+                requests.get(f"{stub.url}games.json", timeout=db.timeout).json()
+                for game_id in game_ids:
+                    requests.get(f"{stub.url}comments/{game_id}.json", timeout=db.timeout).json()
+            
+            def refresh_pooled():
+                db._request('GET', "games").json()
+                for game_id in game_ids:
+                    db._request('GET', f"comments/{game_id}").json()
+            
+            refresh_pooled()
+            print(f"Refresh de {args.games} jogos ({calls} GETs), {args.rounds} rodadas")
+            report("requests.get por chamada", measure(refresh_per_call, args.rounds), calls)
+            report("Database.session (keep-alive)", measure(refresh_pooled, args.rounds), calls)
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import argparse
+import random
+import string
+
+from common import main_module, measure, report
+
+FIRST = ["Grand", "Dark", "Super", "Final", "Mega", "Shadow", "Crystal", "Iron", "Silent", "Eternal",
+         "Cyber", "Royal", "Frozen", "Hidden", "Savage", "Mystic", "Broken", "Golden", "Wild", "Lost"]
+SECOND = ["Theft", "Souls", "Racing", "Fantasy", "Warriors", "Legends", "Kingdom", "Empire", "Hunter", "Knight",
+          "Dragon", "Galaxy", "Outlaw", "Pirates", "Samurai", "Zombies", "Rebels", "Titans", "Wizards", "Ninjas",
+          "Skyrim", "Citadel", "Odyssey", "Chronicles", "Horizon"]
+THIRD = ["Vice City", "Origins", "Remastered", "Reloaded", "Anthology", "Redemption", "Revolution", "Evolution",
+         "Uprising", "Awakening", "Collection", "Deluxe", "Definitive", "Rising", "Unleashed", "Forever",
+         "Tactics", "Arena", "Frontier", "Nightfall"]
+TAGS = ["RPG", "Ação", "Aventura", "Terror", "Corrida", "Esporte", "Estratégia", "Indie", "Luta", "top"]
+
+
+def build_catalog(games):
+    catalog = {}
+    i = 0
+    while len(catalog) < games:
+        name = f"{random.choice(FIRST)} {random.choice(SECOND)} {random.choice(THIRD)} {i % 40 + 1}"
+        i += 1
+        game_id = "".join(c if c.isalnum() else "_" for c in name.lower())
+        if game_id not in catalog:
+            catalog[game_id] = {"nome": name, "tags": random.sample(TAGS, 2), "desc": "Roda bem no Winlator"}
+    return catalog
+
+
+def misspell(name):
+    words = name.split()
+    long_words = [i for i, w in enumerate(words) if len(w) >= 5]
+    i = random.choice(long_words)
+    word = words[i]
+    pos = random.randrange(1, len(word) - 1)
+    edit = random.choice(("delete", "replace", "insert", "swap"))
+    if edit == "delete":
+        word = word[:pos] + word[pos + 1:]
+    elif edit == "replace":
+        word = word[:pos] + random.choice(string.ascii_lowercase) + word[pos + 1:]
+    elif edit == "insert":
+        word = word[:pos] + random.choice(string.ascii_lowercase) + word[pos:]
+    else:
+        word = word[:pos - 1] + word[pos] + word[pos - 1] + word[pos + 1:]
+    words[i] = word
+    return " ".join(words).lower()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--scan-queries", type=int, default=20)
+    args = parser.parse_args()
+    
+    random.seed(22)
+    with main_module() as main:
+        catalog = build_catalog(args.games)
+        comments = {game_id: random.randint(0, 500) for game_id in catalog}
+        popularity = lambda game_id, game: comments[game_id]
+        index = main.SearchIndex()
+        
+        print(f"Catálogo sintético de {args.games} jogos, {args.queries} buscas com erro de digitação")
+        report("montar índice", measure(lambda: index.sync(catalog, 1)))
+        
+        targets = random.sample(sorted(catalog), args.queries)
+        queries = [(game_id, misspell(catalog[game_id]["nome"])) for game_id in targets]
+        exact = [catalog[game_id]["nome"].lower() for game_id in targets]
+        
+        report("busca exata", measure(lambda: [index.search(q, 10, popularity) for q in exact]), len(exact))
+        report("busca com erro (índice)", measure(lambda: [index.search(q, 10, popularity) for _, q in queries]), len(queries))
+        
+        hits = sum(catalog[game_id] in index.search(q, 10, popularity) for game_id, q in queries)
+        print(f"{'acertos no top 10':<40} {hits}/{len(queries)}")
+        
+        titles = [main.SearchIndex.fold(g["nome"]) for g in catalog.values()]
+        
+        def scan():
+            for _, q in queries[:args.scan_queries]:
+                folded = main.SearchIndex.fold(q)
+                bound = main.SEARCH_MAX_EDIT_DISTANCE
+                matches = [(main.SearchIndex.distance(folded, t, bound), t) for t in titles]
+                sorted(m for m in matches if m[0] <= bound)[:10]
+        
+        report("varredura Levenshtein (sem índice)", measure(scan), args.scan_queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+
+from common import main_module, measure, report
+
+
+def seed(workdir, users, comments):
+    users_file = os.path.join(workdir, "users_database.json")
+    admin_file = os.path.join(workdir, "admin_list.json")
+    outbox_file = os.path.join(workdir, "outbox.json")
+    
+    with open(users_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            f"User{i:07d}": {"password": f"{i:064x}", "created_at": "01/01/2024 12:00"}
+            for i in range(users)
+        }, f, indent=4)
+    with open(admin_file, 'w', encoding='utf-8') as f:
+        json.dump({"admins": [f"User{i:07d}" for i in range(0, users, 1000)]}, f, indent=4)
+    with open(outbox_file, 'w', encoding='utf-8') as f:
+        json.dump([
+            {
+                "id": f"-N{i:018d}",
+                "kind": "add_comment",
+                "game": f"game_{i % 5000}",
+                "comment_id": f"-N{i:018d}",
+                "data": {"user": f"User{i % users:07d}", "text": "Roda liso no Winlator", "date": "01/01/2024 12:00"},
+                "created_at": "01/01/2024 12:00"
+            }
+            for i in range(comments)
+        ], f, indent=4)
+    return users_file, admin_file, outbox_file
+
+
+def run(label, store, writer, args):
+    names = [f"user{random.randrange(args.users):07d}" for _ in range(args.lookups)]
+    report(f"{label}: login (find_user)", measure(lambda: [store.find_user(n) for n in names]), args.lookups)
+    
+    counter = iter(range(10 ** 9))
+    
+    def register():
+        for _ in range(args.writes):
+            store.add_user(f"New{next(counter):07d}", {"password": "x" * 64, "created_at": "01/01/2024 12:00"})
+        writer.flush()
+    
+    report(f"{label}: cadastro (add_user)", measure(register), args.writes)
+    
+    ops = store.load_outbox()
+    report(f"{label}: carregar outbox", measure(store.load_outbox))
+    
+    def queue_comment():
+        for _ in range(args.outbox_writes):
+            op = dict(ops[-1], id=f"-Z{next(counter):018d}")
+            ops.append(op)
+            store.save_outbox(ops, [op], set())
+        writer.flush()
+    
+    report(f"{label}: enfileirar comentário", measure(queue_comment), args.outbox_writes)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--comments", type=int, default=1000000)
+    parser.add_argument("--lookups", type=int, default=100)
+    parser.add_argument("--writes", type=int, default=20)
+    parser.add_argument("--outbox-writes", type=int, default=3)
+    args = parser.parse_args()
+    
+    with main_module() as main:
+        workdir = tempfile.mkdtemp(prefix="winlator_store_")
+        try:
+            files = seed(workdir, args.users, args.comments)
+            print(f"{args.users} usuários, {args.comments} comentários no outbox")
+            
+            writer = main.FileWriter()
+            store = main.JsonStore(*files, writer)
+            run("JSON", store, writer, args)
+            writer.stop()
+            
+            files = seed(workdir, args.users, args.comments)
+            store = main.SqliteStore(os.path.join(workdir, "winlator_hub.db"))
+            report("SQLite: importação única", measure(lambda: store.import_json(*files)))
+            run("SQLite", store, writer, args)
+            store.close()
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
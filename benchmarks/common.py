@@ -0,0 +1,49 @@
+import contextlib
+import importlib.util
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+
+@contextlib.contextmanager
+def main_module():
+    if importlib.util.find_spec("kivy") is None:
+        sys.exit("Os benchmarks precisam do Kivy instalado (pip install kivy)")
+    
+    workdir = tempfile.mkdtemp(prefix="winlator_bench_")
+    shutil.copy(os.path.join(ROOT, "main.py"), os.path.join(workdir, "main.py"))
+    spec = importlib.util.spec_from_file_location("main", os.path.join(workdir, "main.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["main"] = module
+    try:
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        if hasattr(module, "db"):
+            module.db.close()
+        sys.modules.pop("main", None)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def measure(fn, repeat=1):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(label, times, count=1):
+    per_call = [t / count for t in times]
+    print(f"{label:<40} total {min(times) * 1000:10.1f} ms   "
+          f"mediana {statistics.median(per_call) * 1e6:10.1f} us/op")
@@ -12,20 +12,88 @@ from kivy.uix.image import Image, AsyncImage
 from kivy.metrics import dp
 from kivy.graphics import Color, RoundedRectangle, Rectangle, Line
 from kivy.clock import Clock
+from kivy.loader import Loader
 from kivy.utils import platform
 import webbrowser
 import os
 import json
+import marshal
+import mmap
 import hashlib
+import heapq
 import base64
+import random
+import re
 import requests
+import struct
 import threading
+import time
+import unicodedata
+from bisect import bisect_left
+import zlib
 
+from requests.adapters import HTTPAdapter
+
+from collections import OrderedDict
 from datetime import datetime
 from functools import partial
 
 FIREBASE_URL = "link to your database"
 
+HTTP_POOL_CONNECTIONS = 2
+HTTP_POOL_MAXSIZE = 8
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_READ_TIMEOUT = 10
+HTTP_WRITE_TIMEOUT = 15
+
+HTTP_MAX_RETRIES = 2
+HTTP_RETRY_BASE_DELAY = 0.25
+HTTP_RETRY_MAX_DELAY = 2
+
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_COOLDOWN = 10
+CIRCUIT_MAX_COOLDOWN = 120
+CIRCUIT_PROBE_TIMEOUT = 3
+
+CATALOG_TTL = 300
+
+COMMENTS_PAGE_SIZE = 20
+COMMENT_CACHE_SIZE = 32
+COMMENT_CACHE_TTL = 120
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_RETRY_DELAY = 30
+
+STORAGE_ENGINE = "sqlite"
+FILE_WRITE_DELAY = 0.5
+
+CACHE_FORMAT = "binary"
+CACHE_MAGIC = b"WHGC"
+CACHE_VERSION = 1
+CACHE_HEADER = "<4sHBII"
+
+INDEX_MAGIC = b"WHGI"
+INDEX_VERSION = 2
+INDEX_HEADER = "<4sHII"
+INDEX_ENTRY = "<IIII"
+
+SEARCH_RESULT_LIMIT = 200
+SEARCH_FUZZY_MIN_RESULTS = 5
+SEARCH_MAX_EDIT_DISTANCE = 2
+SEARCH_TOP_BONUS = 100
+SEARCH_REFINE_SCAN = 2000
+SUGGESTION_LIMIT = 5
+TAG_INDEX_REBUILD_RATIO = 0.125
+
+PREFETCH_MAX_WORKERS = 2
+PREFETCH_MARGIN = 1.0
+PREFETCH_DELAY = 0.2
+PREFETCH_IMAGE_LIMIT = 100
+PREFETCH_IMAGE_TTL = 60
+
+LIVE_SYNC_ENABLED = True
+LIVE_SYNC_READ_TIMEOUT = 90
+LIVE_SYNC_MAX_BACKOFF = 60
+
 
 COR_FUNDO_APP = (0, 0, 0, 1)
 COR_BTN_GAME = (0.12, 0.12, 0.16, 1)
@@ -46,9 +114,1016 @@ COR_CARD_REPLY = (0.06, 0.06, 0.09, 1)
 
 ADMIN_KEY_ENCODED = "your own key"
 
+PUSH_CHARS = "-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz"
 
-class Database:
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, probe, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, cooldown=CIRCUIT_COOLDOWN,
+                 max_cooldown=CIRCUIT_MAX_COOLDOWN):
+        self.probe = probe
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.listeners = []
+        self.metrics = {
+            "successes": 0,
+            "failures": 0,
+            "rejected": 0,
+            "opened": 0,
+            "half_opened": 0,
+            "closed": 0,
+            "last_change": None
+        }
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+    
+    def allow_request(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            self.metrics["rejected"] += 1
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            self.metrics["successes"] += 1
+            self.failures = 0
+            changed = self._transition(self.CLOSED)
+        self._notify(changed)
+    
+    def record_failure(self, trip=False):
+        with self._lock:
+            self.metrics["failures"] += 1
+            self.failures += 1
+            changed = None
+            if self.state == self.CLOSED and (trip or self.failures >= self.failure_threshold):
+                changed = self._transition(self.OPEN)
+        self._notify(changed)
+        if changed:
+            threading.Thread(target=self._probe_loop, daemon=True).start()
+    
+    def _transition(self, state):
+        if self.state == state:
+            return None
+        old_state = self.state
+        self.state = state
+        self.metrics[{self.CLOSED: "closed", self.OPEN: "opened", self.HALF_OPEN: "half_opened"}[state]] += 1
+        self.metrics["last_change"] = time.time()
+        return old_state, state
+    
+    def _notify(self, changed):
+        if not changed:
+            return
+        for listener in list(self.listeners):
+            try:
+                listener(*changed)
+            except Exception:
+                pass
+    
+    def _probe_loop(self):
+        cooldown = self.cooldown
+        while not self._stop_event.wait(cooldown * random.uniform(0.8, 1.2)):
+            with self._lock:
+                if self.state != self.OPEN:
+                    return
+                changed = self._transition(self.HALF_OPEN)
+            self._notify(changed)
+            
+            try:
+                healthy = self.probe()
+            except Exception:
+                healthy = False
+            
+            if healthy:
+                with self._lock:
+                    self.failures = 0
+                    changed = self._transition(self.CLOSED)
+                self._notify(changed)
+                return
+            
+            with self._lock:
+                changed = self._transition(self.OPEN)
+            self._notify(changed)
+            cooldown = min(cooldown * 2, self.max_cooldown)
+    
+    def stop(self):
+        self._stop_event.set()
+
+
+class CommentCache:
+    def __init__(self, max_entries=COMMENT_CACHE_SIZE, ttl=COMMENT_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, game_key, field):
+        with self._lock:
+            entry = self._entries.get(game_key)
+            if entry is None or field not in entry or time.monotonic() - entry[field][1] >= self.ttl:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(game_key)
+            self.hits += 1
+            return entry[field][0]
+    
+    def put(self, game_key, field, value, stamp=None):
+        with self._lock:
+            entry = self._entries.setdefault(game_key, {})
+            entry[field] = (value, time.monotonic() if stamp is None else stamp)
+            self._entries.move_to_end(game_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def update(self, game_key, change):
+        with self._lock:
+            entry = self._entries.get(game_key)
+            if entry is None:
+                return
+            for field, (value, stamp) in list(entry.items()):
+                value = change(field, value)
+                if value is None:
+                    del entry[field]
+                else:
+                    entry[field] = (value, stamp)
+    
+    def invalidate(self, game_key):
+        with self._lock:
+            self._entries.pop(game_key, None)
+
+
+class FileWriter:
+    def __init__(self, delay=FILE_WRITE_DELAY):
+        self.delay = delay
+        self._pending = {}
+        self._inflight = {}
+        self._cond = threading.Condition()
+        self._running = True
+        self._thread = None
+    
+    def write_bytes(self, path, data):
+        self._submit(path, data)
+    
+    def write_text(self, path, text):
+        self._submit(path, text.encode('utf-8'))
+    
+    def write_json(self, path, data):
+        self.write_text(path, json.dumps(data, indent=4, ensure_ascii=False))
+    
+    def write_deferred(self, path, produce):
+        self._submit(path, produce)
+    
+    def remove(self, path):
+        self._submit(path, None)
+    
+    def pending(self, path):
+        with self._cond:
+            if path in self._pending:
+                return True, self._pending[path][0]
+            if path in self._inflight:
+                return True, self._inflight[path]
+            return False, None
+    
+    def read_bytes(self, path):
+        found, payload = self.pending(path)
+        if not found:
+            with open(path, 'rb') as f:
+                return f.read()
+        if callable(payload):
+            produce, payload = payload, payload()
+            with self._cond:
+                entry = self._pending.get(path)
+                if entry is not None and entry[0] is produce:
+                    entry[0] = payload
+        if payload is None:
+            raise FileNotFoundError(path)
+        return payload
+    
+    def read_text(self, path):
+        return self.read_bytes(path).decode('utf-8')
+    
+    def read_json(self, path):
+        return json.loads(self.read_text(path))
+    
+    def _submit(self, path, payload):
+        with self._cond:
+            if path in self._pending:
+                self._pending[path][0] = payload
+            else:
+                self._pending[path] = [payload, time.time() + self.delay]
+            
+            if not self._running:
+                self._flush_sync()
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                
+                now = time.time()
+                due = [p for p, (_, deadline) in self._pending.items() if deadline <= now or not self._running]
+                if not due:
+                    self._cond.wait(min(d for _, d in self._pending.values()) - now)
+                    continue
+                
+                for path in due:
+                    self._inflight[path] = self._pending.pop(path)[0]
+                batch = list(self._inflight.items())
+            
+            for path, payload in batch:
+                self._write(path, payload)
+            
+            with self._cond:
+                for path, _ in batch:
+                    self._inflight.pop(path, None)
+                self._cond.notify_all()
+    
+    def _write(self, path, payload):
+        try:
+            if callable(payload):
+                payload = payload()
+            if payload is None:
+                if os.path.exists(path):
+                    os.remove(path)
+                return
+            
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except Exception:
+            pass
+    
+    def _flush_sync(self):
+        pending = [(p, v[0]) for p, v in self._pending.items()]
+        self._pending.clear()
+        for path, payload in pending:
+            self._write(path, payload)
+    
+    def flush(self):
+        with self._cond:
+            for entry in self._pending.values():
+                entry[1] = 0
+            self._cond.notify_all()
+            while self._thread is not None and self._thread.is_alive() and (self._pending or self._inflight):
+                self._cond.wait(0.1)
+            self._flush_sync()
+    
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        with self._cond:
+            self._flush_sync()
+
+
+class CatalogIndex:
+    def __init__(self, buffer, handle=None):
+        self.buffer = buffer
+        self._handle = handle
+        
+        magic, version, self.count, names_len = struct.unpack_from(INDEX_HEADER, buffer)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError("Formato de indice desconhecido")
+        
+        self.entry_size = struct.calcsize(INDEX_ENTRY)
+        self._table = struct.calcsize(INDEX_HEADER)
+        self._names = self._table + self.count * self.entry_size
+        self._records = self._names + names_len
+        if len(buffer) < self._records:
+            raise ValueError("Indice truncado")
+    
+    @classmethod
+    def open(cls, path, writer):
+        found, _ = writer.pending(path)
+        if found:
+            return cls(writer.read_bytes(path))
+        
+        with open(path, 'rb') as f:
+            handle = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(handle, handle)
+    
+    @staticmethod
+    def normalize(text):
+        if text.isascii():
+            return text.casefold()
+        text = unicodedata.normalize('NFKD', text)
+        return "".join(c for c in text if not unicodedata.combining(c)).casefold()
+    
+    @staticmethod
+    def build(entries):
+        entries = sorted(entries, key=lambda entry: entry[0])
+        table = bytearray()
+        names = bytearray()
+        records = bytearray()
+        for name, encoded in entries:
+            name_bytes = name.encode('utf-8')
+            table += struct.pack(INDEX_ENTRY, len(names), len(name_bytes), len(records), len(encoded))
+            names += name_bytes
+            records += encoded
+        
+        header = struct.pack(INDEX_HEADER, INDEX_MAGIC, INDEX_VERSION, len(entries), len(names))
+        return header + bytes(table) + bytes(names) + bytes(records)
+    
+    def __len__(self):
+        return self.count
+    
+    def _entry(self, i):
+        return struct.unpack_from(INDEX_ENTRY, self.buffer, self._table + i * self.entry_size)
+    
+    def name(self, i):
+        name_offset, name_len, _, _ = self._entry(i)
+        start = self._names + name_offset
+        return bytes(self.buffer[start:start + name_len]).decode('utf-8')
+    
+    def game(self, i):
+        _, _, record_offset, record_len = self._entry(i)
+        start = self._records + record_offset
+        return json.loads(bytes(self.buffer[start:start + record_len]).decode('utf-8'))
+    
+    def games(self, start=0, stop=None):
+        stop = self.count if stop is None else min(stop, self.count)
+        return [self.game(i) for i in range(start, stop)]
+    
+    def bisect(self, key):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.name(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+    
+    def prefix(self, text, limit=None):
+        key = self.normalize(text)
+        result = []
+        i = self.bisect(key)
+        while i < self.count and (limit is None or len(result) < limit) and self.name(i).startswith(key):
+            result.append(self.game(i))
+            i += 1
+        return result
+    
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+
+
+class SearchIndex:
     def __init__(self):
+        self.version = None
+        self._lock = threading.Lock()
+        self._numbers = {}
+        self._docs = {}
+        self._fields = {}
+        self._grams = {}
+        self._prefixes = {}
+        self._words = {}
+        self._terms = {}
+        self._term_grams = {}
+        self._vocabulary = None
+        self._term_vocabulary = None
+        self._next_number = 0
+    
+    @staticmethod
+    def fold(text):
+        text = CatalogIndex.normalize(text if isinstance(text, str) else "")
+        return " ".join(re.split(r"[\W_]+", text)).strip()
+    
+    @staticmethod
+    def trigrams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    @staticmethod
+    def edit_bound(term):
+        if len(term) < 4:
+            return 0
+        return min(1 if len(term) < 7 else 2, SEARCH_MAX_EDIT_DISTANCE)
+    
+    @staticmethod
+    def distance(a, b, bound):
+        if abs(len(a) - len(b)) > bound:
+            return bound + 1
+        before, previous = None, list(range(len(b) + 1))
+        for i in range(1, len(a) + 1):
+            current = [i]
+            for j in range(1, len(b) + 1):
+                cost = current[j - 1] + 1
+                if previous[j] + 1 < cost:
+                    cost = previous[j] + 1
+                if previous[j - 1] + (a[i - 1] != b[j - 1]) < cost:
+                    cost = previous[j - 1] + (a[i - 1] != b[j - 1])
+                if before is not None and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1] and before[j - 2] + 1 < cost:
+                    cost = before[j - 2] + 1
+                current.append(cost)
+            if min(current) > bound:
+                return bound + 1
+            before, previous = previous, current
+        return previous[-1]
+    
+    def _keys(self, name, tags, desc):
+        grams = self.trigrams(name) | self.trigrams(tags)
+        terms = set((name + " " + tags).split())
+        prefixes = set()
+        for word in terms:
+            prefixes.add(word[:1])
+            prefixes.add(word[:2])
+        return grams, prefixes, set(desc.split()), terms
+    
+    def add(self, game_id, game):
+        self.remove(game_id)
+        tags = game.get('tags')
+        name = self.fold(game.get('nome', ''))
+        tags = " ".join(self.fold(t) for t in tags) if isinstance(tags, list) else ""
+        desc = self.fold(game.get('desc', ''))
+        
+        number = self._next_number
+        self._next_number += 1
+        self._numbers[game_id] = number
+        self._docs[number] = (game_id, game)
+        self._fields[number] = (name, tags, desc)
+        
+        grams, prefixes, words, terms = self._keys(name, tags, desc)
+        for gram in grams:
+            self._grams.setdefault(gram, set()).add(number)
+        for prefix in prefixes:
+            self._prefixes.setdefault(prefix, set()).add(number)
+        for word in words:
+            if word not in self._words:
+                self._words[word] = set()
+                self._vocabulary = None
+            self._words[word].add(number)
+        for term in terms:
+            if term not in self._terms:
+                self._terms[term] = set()
+                self._term_vocabulary = None
+                for gram in self.trigrams("$" + term + "$"):
+                    self._term_grams.setdefault(gram, set()).add(term)
+            self._terms[term].add(number)
+    
+    def remove(self, game_id):
+        number = self._numbers.pop(game_id, None)
+        if number is None:
+            return
+        del self._docs[number]
+        grams, prefixes, words, terms = self._keys(*self._fields.pop(number))
+        for postings, keys in ((self._grams, grams), (self._prefixes, prefixes), (self._words, words), (self._terms, terms)):
+            for key in keys:
+                docs = postings.get(key)
+                if docs is None:
+                    continue
+                docs.discard(number)
+                if not docs:
+                    del postings[key]
+                    if postings is self._words:
+                        self._vocabulary = None
+                    elif postings is self._terms:
+                        self._term_vocabulary = None
+                        for gram in self.trigrams("$" + key + "$"):
+                            self._term_grams[gram].discard(key)
+                            if not self._term_grams[gram]:
+                                del self._term_grams[gram]
+    
+    def sync(self, catalog, version):
+        with self._lock:
+            if version is not None and version == self.version:
+                return
+            for game_id in [g for g in self._numbers if g not in catalog]:
+                self.remove(game_id)
+            for game_id, game in catalog.items():
+                number = self._numbers.get(game_id)
+                if number is None or (self._docs[number][1] is not game and self._docs[number][1] != game):
+                    self.add(game_id, game)
+            self.version = version
+    
+    @staticmethod
+    def _prefixed(vocabulary, prefix):
+        i = bisect_left(vocabulary, prefix)
+        while i < len(vocabulary) and vocabulary[i].startswith(prefix):
+            yield vocabulary[i]
+            i += 1
+    
+    def _words_with_prefix(self, prefix):
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._words)
+        
+        docs = set()
+        for word in self._prefixed(self._vocabulary, prefix):
+            docs |= self._words[word]
+        return docs
+    
+    def _fuzzy_candidates(self, term):
+        if self._term_vocabulary is None:
+            self._term_vocabulary = sorted(self._terms)
+        
+        bound = self.edit_bound(term)
+        matches = dict.fromkeys(self._prefixed(self._term_vocabulary, term), 0)
+        if bound:
+            grams = self.trigrams("$" + term + "$")
+            shared = {}
+            for gram in grams:
+                for word in self._term_grams.get(gram, ()):
+                    shared[word] = shared.get(word, 0) + 1
+            needed = max(len(grams) - 4 * bound, 1)
+            for word, count in shared.items():
+                if count >= needed and word not in matches:
+                    distance = self.distance(term, word, bound)
+                    if distance <= bound:
+                        matches[word] = distance
+        
+        docs = {}
+        for word, distance in matches.items():
+            for number in self._terms[word]:
+                if distance < docs.get(number, bound + 1):
+                    docs[number] = distance
+        return docs
+    
+    def _candidates(self, term):
+        if len(term) < 3:
+            docs = set(self._prefixes.get(term, ()))
+        else:
+            postings = sorted((self._grams.get(g, set()) for g in self.trigrams(term)), key=len)
+            docs = postings[0].intersection(*postings[1:])
+        return docs | self._words_with_prefix(term)
+    
+    def _score(self, term, name, tags, desc):
+        name_score = 0
+        if name == term:
+            name_score = 4
+        elif name.startswith(term):
+            name_score = 3
+        elif (" " + term) in (" " + name):
+            name_score = 2
+        elif term in name:
+            name_score = 1
+        
+        score = 0
+        if term in tags.split():
+            score += 30
+        elif term in tags:
+            score += 20
+        
+        if (" " + term) in (" " + desc):
+            score += 10
+        return name_score, score
+    
+    def _popularity(self, number, popularity):
+        return -popularity(*self._docs[number]) if popularity else 0
+    
+    @staticmethod
+    def can_refine(previous, current):
+        if not previous or not current.startswith(previous):
+            return False
+        old, new = previous.split(), current.split()
+        return not len(old[-1]) < 3 <= len(new[len(old) - 1])
+    
+    def _exact(self, terms, popularity, within=None):
+        if within is not None and len(within) <= SEARCH_REFINE_SCAN:
+            starts = [" " + term for term in terms if len(term) < 3]
+            matches = [n for n in within if all(t in " " + " ".join(self._fields[n]) for t in starts)]
+        else:
+            matches = within
+            for term in sorted(terms, key=len, reverse=True):
+                docs = self._candidates(term)
+                matches = docs if matches is None else matches & docs
+                if not matches:
+                    return []
+        
+        ranked = []
+        for number in matches:
+            name, tags, desc = self._fields[number]
+            name_score = score = 0
+            for term in terms:
+                term_name_score, term_score = self._score(term, name, tags, desc)
+                if not term_name_score and not term_score:
+                    break
+                name_score += term_name_score
+                score += term_score
+            else:
+                ranked.append((0, -name_score, -score, self._popularity(number, popularity), name, number))
+        return ranked
+    
+    def _fuzzy(self, terms, popularity, exclude):
+        distances = None
+        for term in sorted(terms, key=len):
+            docs = self._fuzzy_candidates(term)
+            if distances is None:
+                distances = {n: d for n, d in docs.items() if n not in exclude}
+            else:
+                distances = {n: d + docs[n] for n, d in distances.items() if n in docs}
+            if not distances:
+                return []
+        return [(1, distance, 0, self._popularity(number, popularity), self._fields[number][0], number)
+                for number, distance in distances.items()]
+    
+    def search(self, query, limit=None, popularity=None):
+        return self.search_matches(query, limit, popularity)[0]
+    
+    def search_matches(self, query, limit=None, popularity=None, within=None, version=None):
+        terms = self.fold(query).split()
+        if not terms:
+            return [], set()
+        
+        with self._lock:
+            if version != self.version:
+                within = None
+            ranked = self._exact(terms, popularity, within)
+            matches = {entry[-1] for entry in ranked}
+            if len(ranked) < SEARCH_FUZZY_MIN_RESULTS and any(self.edit_bound(t) for t in terms):
+                ranked += self._fuzzy(terms, popularity, matches)
+            if limit is not None and limit < len(ranked):
+                ranked = heapq.nsmallest(limit, ranked)
+            else:
+                ranked.sort()
+            return [self._docs[entry[-1]][1] for entry in ranked], matches
+
+
+class SuggestionIndex:
+    def __init__(self):
+        self.version = None
+        self._arrays = ([], [], [], [])
+    
+    def load(self, catalog, version):
+        titles = []
+        words = []
+        for game in catalog.values():
+            name = game.get('nome')
+            if not isinstance(name, str):
+                continue
+            parts = SearchIndex.fold(name).split()
+            if not parts:
+                continue
+            titles.append((" ".join(parts), name))
+            for i in range(1, len(parts)):
+                words.append((" ".join(parts[i:]), name))
+        titles.sort()
+        words.sort()
+        self._arrays = ([k for k, _ in titles], [n for _, n in titles], [k for k, _ in words], [n for _, n in words])
+        self.version = version
+    
+    def suggest(self, text, limit=SUGGESTION_LIMIT):
+        key = SearchIndex.fold(text)
+        if not key:
+            return []
+        
+        title_keys, title_names, word_keys, word_names = self._arrays
+        result = []
+        for keys, names in ((title_keys, title_names), (word_keys, word_names)):
+            i = bisect_left(keys, key)
+            while i < len(keys) and len(result) < limit and keys[i].startswith(key):
+                if names[i] not in result:
+                    result.append(names[i])
+                i += 1
+        return result
+
+
+class TagIndex:
+    def __init__(self):
+        self.version = None
+        self._lock = threading.Lock()
+        self._slots = {}
+        self._games = []
+        self._game_tags = {}
+        self._names = {}
+        self._tags = {}
+    
+    def _tags_of(self, game):
+        tags = game.get('tags')
+        if not isinstance(tags, list):
+            return frozenset()
+        return frozenset(self._names.setdefault(t, t) for t in tags if isinstance(t, str))
+    
+    def _rebuild(self, catalog):
+        self._slots = {}
+        self._games = []
+        self._game_tags = {}
+        members = {}
+        for game_id, game in catalog.items():
+            slot = len(self._games)
+            tags = self._tags_of(game)
+            self._slots[game_id] = slot
+            self._games.append(game)
+            self._game_tags[game_id] = tags
+            for tag in tags:
+                members.setdefault(tag, []).append(slot)
+        
+        self._tags = {}
+        for tag, slots in members.items():
+            data = bytearray(slots[-1] // 8 + 1)
+            for slot in slots:
+                data[slot >> 3] |= 1 << (slot & 7)
+            self._tags[tag] = int.from_bytes(data, 'little')
+    
+    def _set_tags(self, slot, old, new):
+        bit = 1 << slot
+        for tag in old - new:
+            bits = self._tags[tag] & ~bit
+            if bits:
+                self._tags[tag] = bits
+            else:
+                del self._tags[tag]
+        for tag in new - old:
+            self._tags[tag] = self._tags.get(tag, 0) | bit
+    
+    def sync(self, catalog, version):
+        with self._lock:
+            if version is not None and version == self.version:
+                return
+            
+            removed = [g for g in self._slots if g not in catalog]
+            changed = []
+            appended = False
+            in_order = True
+            for game_id, game in catalog.items():
+                slot = self._slots.get(game_id)
+                if slot is None:
+                    appended = True
+                    changed.append((game_id, game))
+                else:
+                    in_order = in_order and not appended
+                    if self._games[slot] is not game and self._games[slot] != game:
+                        changed.append((game_id, game))
+            
+            holes = len(self._games) - len(self._slots) + len(removed)
+            if not in_order or len(changed) + holes > len(catalog) * TAG_INDEX_REBUILD_RATIO:
+                self._rebuild(catalog)
+            else:
+                for game_id in removed:
+                    slot = self._slots.pop(game_id)
+                    self._set_tags(slot, self._game_tags.pop(game_id), frozenset())
+                    self._games[slot] = None
+                for game_id, game in changed:
+                    slot = self._slots.get(game_id)
+                    if slot is None:
+                        slot = len(self._games)
+                        self._slots[game_id] = slot
+                        self._games.append(game)
+                    self._games[slot] = game
+                    tags = self._tags_of(game)
+                    self._set_tags(slot, self._game_tags.get(game_id, frozenset()), tags)
+                    self._game_tags[game_id] = tags
+            self.version = version
+    
+    def select(self, tags):
+        with self._lock:
+            if not tags:
+                return [g for g in self._games if g is not None]
+            
+            bits = None
+            for tag in tags:
+                tag_bits = self._tags.get(tag, 0)
+                bits = tag_bits if bits is None else bits & tag_bits
+                if not bits:
+                    return []
+            
+            result = []
+            for i, byte in enumerate(bits.to_bytes((bits.bit_length() + 7) // 8, 'little')):
+                while byte:
+                    low = byte & -byte
+                    result.append(self._games[(i << 3) + low.bit_length() - 1])
+                    byte ^= low
+            return result
+
+
+class JsonStore:
+    def __init__(self, users_file, admin_file, outbox_file, writer):
+        self.writer = writer
+        self.users_file = users_file
+        self.admin_file = admin_file
+        self.outbox_file = outbox_file
+        self._init_files()
+    
+    def _init_files(self):
+        if not os.path.exists(self.users_file):
+            self._save(self.users_file, {})
+        if not os.path.exists(self.admin_file):
+            self._save(self.admin_file, {"admins": []})
+    
+    def _load(self, path):
+        return self.writer.read_json(path)
+    
+    def _save(self, path, data):
+        self.writer.write_json(path, data)
+    
+    def find_user(self, username):
+        users = self._load(self.users_file)
+        for u in users.keys():
+            if u.lower() == username.lower():
+                return u, users[u]
+        return None, None
+    
+    def add_user(self, username, record):
+        try:
+            users = self._load(self.users_file)
+        except Exception:
+            users = {}
+        
+        if username.lower() in [u.lower() for u in users.keys()]:
+            return False
+        users[username] = record
+        self._save(self.users_file, users)
+        return True
+    
+    def get_admins(self):
+        try:
+            return self._load(self.admin_file).get("admins", [])
+        except Exception:
+            return []
+    
+    def admin_version(self):
+        found, payload = self.writer.pending(self.admin_file)
+        if found:
+            return id(payload)
+        try:
+            stat = os.stat(self.admin_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def add_admin(self, username):
+        try:
+            data = self._load(self.admin_file)
+        except Exception:
+            data = {"admins": []}
+        
+        if username.lower() in [a.lower() for a in data.get("admins", [])]:
+            return False
+        data.setdefault("admins", []).append(username)
+        self._save(self.admin_file, data)
+        return True
+    
+    def remove_admin(self, username):
+        data = self._load(self.admin_file)
+        data["admins"] = [a for a in data["admins"] if a.lower() != username.lower()]
+        self._save(self.admin_file, data)
+    
+    def load_outbox(self):
+        try:
+            return self._load(self.outbox_file)
+        except Exception:
+            return []
+    
+    def save_outbox(self, ops, added, removed_ids):
+        self._save(self.outbox_file, ops)
+    
+    def close(self):
+        pass
+
+
+class SqliteStore:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (
+            username_key TEXT PRIMARY KEY,
+            username TEXT NOT NULL,
+            password TEXT NOT NULL,
+            created_at TEXT
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS admins (
+            username_key TEXT PRIMARY KEY,
+            username TEXT NOT NULL
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS outbox (
+            id TEXT PRIMARY KEY,
+            op TEXT NOT NULL
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        ) WITHOUT ROWID;
+    """
+    
+    def __init__(self, db_file):
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        import sqlite3
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+    
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+    
+    def find_user(self, username):
+        rows = self._query(
+            "SELECT username, password, created_at FROM users WHERE username_key = ?",
+            (username.lower(),)
+        )
+        if not rows:
+            return None, None
+        real_username, password, created_at = rows[0]
+        return real_username, {"password": password, "created_at": created_at}
+    
+    def add_user(self, username, record):
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO users (username_key, username, password, created_at) VALUES (?, ?, ?, ?)",
+                (username.lower(), username, record["password"], record.get("created_at", ""))
+            )
+            return cursor.rowcount == 1
+    
+    def get_admins(self):
+        return [row[0] for row in self._query("SELECT username FROM admins")]
+    
+    def admin_version(self):
+        return self._query("PRAGMA data_version")[0][0]
+    
+    def add_admin(self, username):
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO admins (username_key, username) VALUES (?, ?)",
+                (username.lower(), username)
+            )
+            return cursor.rowcount == 1
+    
+    def remove_admin(self, username):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM admins WHERE username_key = ?", (username.lower(),))
+    
+    def load_outbox(self):
+        return [json.loads(row[0]) for row in self._query("SELECT op FROM outbox ORDER BY id")]
+    
+    def save_outbox(self, ops, added, removed_ids):
+        with self._lock, self.conn:
+            self.conn.executemany("DELETE FROM outbox WHERE id = ?", [(i,) for i in removed_ids])
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO outbox (id, op) VALUES (?, ?)",
+                [(op['id'], json.dumps(op, ensure_ascii=False)) for op in added]
+            )
+    
+    def _load_json(self, path, default):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return default
+    
+    def import_json(self, users_file, admin_file, outbox_file):
+        if self._query("SELECT 1 FROM meta WHERE key = 'json_imported'"):
+            return
+        
+        users = self._load_json(users_file, {})
+        admins = self._load_json(admin_file, {})
+        ops = self._load_json(outbox_file, [])
+        
+        users = users if isinstance(users, dict) else {}
+        admins = admins.get("admins", []) if isinstance(admins, dict) else []
+        ops = ops if isinstance(ops, list) else []
+        
+        user_rows = []
+        for username, record in users.items():
+            if not isinstance(record, dict) or not isinstance(record.get("password"), str):
+                continue
+            created_at = record.get("created_at", "")
+            user_rows.append((username.lower(), username, record["password"], created_at if isinstance(created_at, str) else ""))
+        
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO users (username_key, username, password, created_at) VALUES (?, ?, ?, ?)",
+                user_rows
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO admins (username_key, username) VALUES (?, ?)",
+                [(a.lower(), a) for a in admins if isinstance(a, str)]
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO outbox (id, op) VALUES (?, ?)",
+                [(op['id'], json.dumps(op, ensure_ascii=False)) for op in ops if isinstance(op, dict) and isinstance(op.get('id'), str)]
+            )
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('json_imported', ?)", (datetime.now().isoformat(),))
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class Database:
+    def __init__(self, pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                 connect_timeout=HTTP_CONNECT_TIMEOUT, read_timeout=HTTP_READ_TIMEOUT,
+                 write_timeout=HTTP_WRITE_TIMEOUT, catalog_ttl=CATALOG_TTL, storage_engine=STORAGE_ENGINE,
+                 cache_format=CACHE_FORMAT):
         if platform == 'android':
             from android.storage import app_storage_path
             self.data_dir = app_storage_path()
@@ -62,35 +1137,171 @@ class Database:
         self.admin_file = os.path.join(self.data_dir, "admin_list.json")
         self.saved_login_file = os.path.join(self.data_dir, "saved_login.json")
         self.comments_file = os.path.join(self.data_dir, "comments.json")
+        self.outbox_file = os.path.join(self.data_dir, "outbox.json")
+        self.storage_file = os.path.join(self.data_dir, "winlator_hub.db")
         self.games_cache_file = os.path.join(self.data_dir, "games_cache.json")
+        self.games_cache_bin_file = os.path.join(self.data_dir, "games_cache.bin")
+        self.games_index_file = os.path.join(self.data_dir, "games_cache.idx")
+        self.cache_format = cache_format
+        self.games_etag_file = os.path.join(self.data_dir, "games_cache.etag")
         self._init_files()
+        
+        self.writer = FileWriter()
+        self.store = self._create_store(storage_engine)
+        
+        self.timeout = (connect_timeout, read_timeout)
+        self.write_timeout = (connect_timeout, write_timeout)
+        self.session = self._create_session(pool_connections, pool_maxsize)
+        self.circuit = CircuitBreaker(self._probe_connection)
+        self.circuit.listeners.append(self._on_circuit_change)
+        
+        self.catalog_ttl = catalog_ttl
+        self.catalog_hits = 0
+        self.catalog_misses = 0
+        self._catalog = None
+        self._catalog_time = 0
+        self._catalog_version = 0
+        self.search_index = SearchIndex()
+        self.suggestion_index = SuggestionIndex()
+        self.tag_index = TagIndex()
+        self._suggestions_building = False
+        self._suggestions_lock = threading.Lock()
+        self._catalog_lock = threading.Lock()
+        self._revalidate_callbacks = None
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+        self._catalog_etag = self._load_etag()
+        self._catalog_index = None
+        self._index_records = {}
+        self._index_lock = threading.Lock()
+        self._saved_version = -1
+        self._cache_save_lock = threading.Lock()
+        
+        self._admin_lock = threading.Lock()
+        self._admin_set = None
+        self._admin_version = None
+        
+        self._push_lock = threading.Lock()
+        self._last_push_time = 0
+        self._last_push_rand = [0] * 12
+        
+        self.comment_cache = CommentCache()
+        self._comment_summary = None
+        self._comment_summary_time = 0
+        
+        self.outbox_listeners = []
+        self._outbox_lock = threading.Lock()
+        self._replaying = False
+        self._next_replay_at = 0
+        self._outbox = self.store.load_outbox()
+        self._outbox_pending = len(self._outbox)
+        self._migrate_local_comments()
     
     def _init_files(self):
-        if not os.path.exists(self.users_file):
-            with open(self.users_file, 'w', encoding='utf-8') as f:
-                json.dump({}, f)
         if not os.path.exists(self.games_file):
             with open(self.games_file, 'w', encoding='utf-8') as f:
                 json.dump({"global_games": []}, f)
-        if not os.path.exists(self.admin_file):
-            with open(self.admin_file, 'w', encoding='utf-8') as f:
-                json.dump({"admins": []}, f)
         if not os.path.exists(self.comments_file):
             with open(self.comments_file, 'w', encoding='utf-8') as f:
                 json.dump({}, f)
-        if not os.path.exists(self.games_cache_file):
+        if self.cache_format == "json" and not os.path.exists(self.games_cache_file):
             with open(self.games_cache_file, 'w', encoding='utf-8') as f:
                 json.dump({"games": [], "last_update": ""}, f)
     
+    def _create_store(self, storage_engine):
+        if storage_engine == "sqlite":
+            store = None
+            try:
+                store = SqliteStore(self.storage_file)
+                store.import_json(self.users_file, self.admin_file, self.outbox_file)
+                return store
+            except Exception:
+                if store is not None:
+                    try:
+                        store.close()
+                    except Exception:
+                        pass
+        return JsonStore(self.users_file, self.admin_file, self.outbox_file, self.writer)
+    
+    def _create_session(self, pool_connections, pool_maxsize):
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=True
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({'Connection': 'keep-alive'})
+        return session
+    
+    def _request(self, method, path, timeout=None, **kwargs):
+        retries = HTTP_MAX_RETRIES if method in ('GET', 'PUT', 'DELETE') and not kwargs.get('stream') else 0
+        if threading.current_thread() is threading.main_thread():
+            retries = 0
+        attempt = 0
+        while True:
+            if not self.circuit.allow_request():
+                raise requests.exceptions.ConnectionError("Sem conexão com o servidor (modo offline)")
+            
+            try:
+                response = self.session.request(
+                    method,
+                    f"{FIREBASE_URL}{path}.json",
+                    timeout=timeout or self.timeout,
+                    **kwargs
+                )
+            except requests.exceptions.Timeout:
+                self.circuit.record_failure(trip=True)
+                raise
+            except requests.exceptions.ConnectionError:
+                self.circuit.record_failure()
+                if attempt >= retries:
+                    raise
+            else:
+                if response.status_code < 500:
+                    self.circuit.record_success()
+                    self._schedule_outbox_replay()
+                    return response
+                self.circuit.record_failure()
+                if attempt >= retries:
+                    return response
+                response.close()
+            
+            delay = min(HTTP_RETRY_BASE_DELAY * 2 ** attempt, HTTP_RETRY_MAX_DELAY)
+            time.sleep(delay * random.uniform(0.5, 1))
+            attempt += 1
+    
+    def _probe_connection(self):
+        response = self.session.get(
+            f"{FIREBASE_URL}.json",
+            params={'shallow': 'true'},
+            timeout=(CIRCUIT_PROBE_TIMEOUT, CIRCUIT_PROBE_TIMEOUT)
+        )
+        response.close()
+        return response.status_code < 500
+    
+    def _on_circuit_change(self, old_state, new_state):
+        if new_state == CircuitBreaker.CLOSED:
+            self._schedule_outbox_replay()
+    
+    def is_offline(self):
+        return self.circuit.state != CircuitBreaker.CLOSED
+    
+    def close(self):
+        self.circuit.stop()
+        self.session.close()
+        self.store.close()
+        self.writer.stop()
+    
     def _hash_password(self, password):
         return hashlib.sha256(password.encode()).hexdigest()
     
     def add_global_game(self, game_name, game_link, game_tags=None, game_desc="", game_image_url=""):
         try:
-            existing_games = self.get_global_games()
-            for g in existing_games:
-                if g['nome'].lower() == game_name.lower():
-                    return False, "Jogo ja existe no catalogo!"
+            game_id = self._generate_game_id(game_name)
+            if self._game_exists(game_id):
+                return False, "Jogo ja existe no catalogo!"
             
             game = {
                 "nome": game_name,
@@ -102,16 +1313,10 @@ class Database:
                  "admin_user": App.get_running_app().current_user
             }
             
-            game_id = self._generate_game_id(game_name)
-            
-            response = requests.put(
-                f"{FIREBASE_URL}games/{game_id}.json",
-                json=game,
-                timeout=15
-            )
+            response = self._request('PUT', f"games/{game_id}", json=game, timeout=self.write_timeout)
             
             if response.status_code == 200:
-                self._update_local_cache()
+                self._apply_local_write(game_id, game)
                 return True, "Jogo adicionado ao catalogo!"
             else:
                 return False, f"Erro ao salvar: {response.status_code}"
@@ -123,20 +1328,116 @@ class Database:
         except Exception as e:
             return False, f"Erro: {str(e)}"
     
-    def get_global_games(self):
-        try:
-            response = requests.get(
-                f"{FIREBASE_URL}games.json",
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    games = list(data.values())
-                    self._save_cache(games)
-                    return games
+    def _game_exists(self, game_id):
+        with self._catalog_lock:
+            fresh = self._catalog is not None and time.monotonic() - self._catalog_time < self.catalog_ttl
+            if fresh and game_id in self._catalog:
+                return True
+        
+        response = self._request('GET', f"games/{game_id}", params={'shallow': 'true'})
+        return response.status_code == 200 and response.json() is not None
+    
+    def _apply_local_write(self, game_id, game):
+        with self._catalog_lock:
+            loaded = self._catalog is not None
+        if not loaded:
+            cached = self._get_cached_catalog()
+            if cached is None:
                 return []
+            with self._catalog_lock:
+                if self._catalog is None:
+                    self._catalog = cached
+                    self._catalog_version += 1
+        return self.apply_catalog_event('put', game_id, game, from_server=False)
+    
+    def search_games(self, query, limit=None):
+        return self.refine_search(query, limit)[0]
+    
+    def _indexed_catalog(self):
+        with self._catalog_lock:
+            fresh = self._catalog is not None and time.monotonic() - self._catalog_time < self.catalog_ttl
+        if not fresh:
+            self.get_global_games(stale_ok=True)
+        
+        with self._catalog_lock:
+            return self._catalog or {}, self._catalog_version
+    
+    def filter_games(self, tags):
+        catalog, version = self._indexed_catalog()
+        self.tag_index.sync(catalog, version)
+        return self.tag_index.select(tags)
+    
+    def refine_search(self, query, limit=None, previous=None):
+        catalog, version = self._indexed_catalog()
+        self.search_index.sync(catalog, version)
+        
+        folded = SearchIndex.fold(query)
+        within, within_version = None, None
+        if previous is not None and SearchIndex.can_refine(previous[1], folded):
+            within_version, within = previous[0], previous[2]
+        games, matches = self.search_index.search_matches(query, limit, self._popularity, within, within_version)
+        return games, (version, folded, matches)
+    
+    def suggest_games(self, text, limit=SUGGESTION_LIMIT):
+        self.warm_suggestions()
+        if self.suggestion_index.version is not None:
+            return self.suggestion_index.suggest(text, limit)
+        
+        index = self.get_catalog_index()
+        if index is None or not text.strip():
+            return []
+        return [game.get('nome', '') for game in index.prefix(text.strip(), limit)]
+    
+    def warm_suggestions(self):
+        with self._catalog_lock:
+            if self._catalog is None or self._catalog_version == self.suggestion_index.version:
+                return
+        with self._suggestions_lock:
+            if self._suggestions_building:
+                return
+            self._suggestions_building = True
+        
+        def build():
+            try:
+                while True:
+                    with self._catalog_lock:
+                        catalog = self._catalog
+                        version = self._catalog_version
+                    if catalog is None or version == self.suggestion_index.version:
+                        break
+                    self.suggestion_index.load(catalog, version)
+            finally:
+                with self._suggestions_lock:
+                    self._suggestions_building = False
+        
+        threading.Thread(target=build, daemon=True).start()
+    
+    def _popularity(self, game_id, game):
+        stats = (self._comment_summary or {}).get(game_id) or {}
+        tags = game.get('tags')
+        bonus = SEARCH_TOP_BONUS if isinstance(tags, list) and 'top' in tags else 0
+        return stats.get("comments", 0) + stats.get("replies", 0) + bonus
+    
+    def get_catalog_game(self, game_name):
+        with self._catalog_lock:
+            if self._catalog is None:
+                return None
+            return self._catalog.get(self._generate_game_id(game_name))
+    
+    def get_global_games(self, force=False, stale_ok=False, on_update=None):
+        if not force:
+            games = self._get_fresh_catalog()
+            if games is not None:
+                return games
+            if stale_ok:
+                snapshot = self._get_catalog_snapshot()
+                self._revalidate_catalog(snapshot, on_update)
+                return snapshot
+        
+        try:
+            catalog = self._fetch_catalog()
+            if catalog is not None:
+                return list(catalog.values())
             return self._get_cached_games()
             
         except requests.exceptions.ConnectionError:
@@ -150,12 +1451,10 @@ class Database:
         try:
             game_id = self._generate_game_id(game_name)
             
-            response = requests.delete(
-                f"{FIREBASE_URL}games/{game_id}.json",
-                timeout=10
-            )
+            response = self._request('DELETE', f"games/{game_id}")
             
             if response.status_code == 200:
+                self.invalidate_catalog()
                 self._update_local_cache()
                 return True
             return False
@@ -163,308 +1462,1021 @@ class Database:
         except Exception:
             return False
     
+    def _get_fresh_catalog(self):
+        with self._catalog_lock:
+            if self._catalog is not None and time.monotonic() - self._catalog_time < self.catalog_ttl:
+                self.catalog_hits += 1
+                return list(self._catalog.values())
+            self.catalog_misses += 1
+            return None
+    
+    def _get_catalog_snapshot(self):
+        with self._catalog_lock:
+            if self._catalog is not None:
+                return list(self._catalog.values())
+        
+        cached = self._get_cached_catalog()
+        if not cached:
+            return []
+        with self._catalog_lock:
+            if self._catalog is None:
+                self._catalog = cached
+                self._catalog_version += 1
+            return list(self._catalog.values())
+    
+    def _revalidate_catalog(self, snapshot, on_update):
+        with self._catalog_lock:
+            if self._revalidate_callbacks is not None:
+                if on_update:
+                    self._revalidate_callbacks.append((snapshot, on_update))
+                return
+            self._revalidate_callbacks = [(snapshot, on_update)] if on_update else []
+        
+        def revalidate_thread():
+            games = self.get_global_games(force=True)
+            with self._catalog_lock:
+                callbacks = self._revalidate_callbacks
+                self._revalidate_callbacks = None
+            for old_games, callback in callbacks:
+                if games != old_games or not old_games:
+                    callback(games)
+        
+        threading.Thread(target=revalidate_thread, daemon=True).start()
+    
+    def _set_catalog(self, data):
+        with self._catalog_lock:
+            if self._catalog is None or self._catalog != data:
+                self._catalog_version += 1
+            self._catalog = dict(data)
+            self._catalog_time = time.monotonic()
+            return self._catalog_version
+    
+    def invalidate_catalog(self):
+        with self._catalog_lock:
+            self._catalog = None
+            self._catalog_time = 0
+            self._catalog_version += 1
+    
+    def touch_catalog(self):
+        with self._catalog_lock:
+            if self._catalog is not None:
+                self._catalog_time = time.monotonic()
+    
+    def apply_catalog_event(self, event, path, data, from_server=True):
+        parts = [p for p in path.split('/') if p]
+        
+        with self._catalog_lock:
+            old_catalog = self._catalog if self._catalog is not None else {}
+            catalog = dict(old_catalog)
+            
+            if not parts:
+                if event == 'put':
+                    catalog = dict(data or {})
+                    touched = set(old_catalog) | set(catalog)
+                else:
+                    for game_id, game in (data or {}).items():
+                        self._set_catalog_entry(catalog, game_id, game)
+                    touched = set((data or {}).keys())
+            else:
+                game_id = parts[0]
+                if len(parts) == 1 and event == 'put':
+                    self._set_catalog_entry(catalog, game_id, data)
+                else:
+                    game = json.loads(json.dumps(catalog.get(game_id) or {}))
+                    if event == 'put' and len(parts) > 1:
+                        self._set_nested(game, parts[1:], data)
+                    else:
+                        for key, value in (data or {}).items():
+                            self._set_nested(game, parts[1:] + [key], value)
+                    self._set_catalog_entry(catalog, game_id, game)
+                touched = {game_id}
+            
+            self._catalog = catalog
+            if from_server:
+                self._catalog_time = time.monotonic()
+            self._catalog_version += 1
+            version = self._catalog_version
+        
+        changes = []
+        for game_id in sorted(touched):
+            old_game = old_catalog.get(game_id)
+            new_game = catalog.get(game_id)
+            if old_game == new_game:
+                continue
+            if old_game is None:
+                changes.append(('add', new_game, None))
+            elif new_game is None:
+                changes.append(('remove', None, old_game))
+            else:
+                changes.append(('update', new_game, old_game))
+        
+        if changes:
+            self._save_cache(catalog, version=version)
+        return changes
+    
+    def _set_catalog_entry(self, catalog, game_id, game):
+        if isinstance(game, dict) and game.get('nome'):
+            catalog[game_id] = game
+        else:
+            catalog.pop(game_id, None)
+    
+    def _set_nested(self, node, keys, value):
+        for key in keys[:-1]:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        if value is None:
+            node.pop(keys[-1], None)
+        else:
+            node[keys[-1]] = value
+    
     def _generate_game_id(self, game_name):
         game_id = game_name.lower()
         game_id = "".join(c if c.isalnum() else "_" for c in game_id)
         return game_id
     
-    def _save_cache(self, games):
+    def _single_flight(self, key, fetch):
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = {"done": threading.Event(), "result": None, "error": None}
+                self._flights[key] = flight
+        
+        if not leader:
+            flight["done"].wait()
+            if flight["error"] is not None:
+                raise flight["error"]
+            return flight["result"]
+        
         try:
-            cache_data = {
-                "games": games,
-                "last_update": datetime.now().strftime("%d/%m/%Y %H:%M")
-            }
-            with open(self.games_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=4, ensure_ascii=False)
+            flight["result"] = fetch()
+            return flight["result"]
+        except Exception as e:
+            flight["error"] = e
+            raise
+        finally:
+            with self._flights_lock:
+                self._flights.pop(key, None)
+            flight["done"].set()
+    
+    def _fetch_catalog(self):
+        return self._single_flight("catalog", self._download_catalog)
+    
+    def _download_catalog(self):
+        headers = {'X-Firebase-ETag': 'true'}
+        if self._catalog_etag:
+            headers['if-none-match'] = self._catalog_etag
+        
+        response = self._request('GET', "games", headers=headers)
+        
+        if response.status_code == 304:
+            with self._catalog_lock:
+                catalog = self._catalog
+            if catalog is None:
+                catalog = self._get_cached_catalog()
+            if catalog is None:
+                self._catalog_etag = None
+                return self._download_catalog()
+            self._set_catalog(catalog)
+            return catalog
+        
+        if response.status_code == 200:
+            data = response.json() or {}
+            version = self._set_catalog(data)
+            if data:
+                self._save_cache(data, response.headers.get('ETag'), version)
+            else:
+                self._save_etag(None)
+            return data
+        return None
+    
+    def _load_etag(self):
+        try:
+            return self.writer.read_text(self.games_etag_file).strip() or None
         except Exception:
-            pass
+            return None
+    
+    def _save_etag(self, etag):
+        self._catalog_etag = etag
+        if etag:
+            self.writer.write_text(self.games_etag_file, etag)
+        else:
+            self.writer.remove(self.games_etag_file)
+    
+    def _save_cache(self, catalog, etag=None, version=0):
+        with self._cache_save_lock:
+            if version < self._saved_version:
+                return
+            self._saved_version = version
+            self._write_cache(catalog, etag)
+    
+    def _write_cache(self, catalog, etag):
+        try:
+            last_update = datetime.now().strftime("%d/%m/%Y %H:%M")
+            if self.cache_format == "binary":
+                self.writer.write_deferred(
+                    self.games_cache_bin_file,
+                    lambda: self._encode_or_none(self._encode_catalog, catalog, last_update)
+                )
+            else:
+                self.writer.write_deferred(
+                    self.games_cache_file,
+                    lambda: self._encode_or_none(self._encode_catalog_json, catalog, last_update)
+                )
+            self._save_index(catalog)
+            self._save_etag(etag)
+        except Exception:
+            self._save_etag(None)
+    
+    def _encode_or_none(self, encode, *args):
+        try:
+            return encode(*args)
+        except Exception:
+            return None
+    
+    def _encode_catalog_json(self, catalog, last_update):
+        cache_data = {
+            "games": list(catalog.values()),
+            "keys": list(catalog.keys()),
+            "last_update": last_update
+        }
+        return json.dumps(cache_data, indent=4, ensure_ascii=False).encode('utf-8')
+    
+    def _save_index(self, catalog):
+        self.writer.write_deferred(self.games_index_file, lambda: self._encode_or_none(self._encode_index, catalog))
+        self._catalog_index = None
+    
+    def _encode_index(self, catalog):
+        with self._index_lock:
+            records = {}
+            entries = []
+            for game_id, game in catalog.items():
+                cached = self._index_records.get(game_id)
+                if cached is None or cached[0] != game:
+                    encoded = json.dumps(game, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+                    cached = (dict(game), encoded, CatalogIndex.normalize(game.get('nome', '')))
+                records[game_id] = cached
+                entries.append((cached[2], cached[1]))
+            
+            self._index_records = records
+            return CatalogIndex.build(entries)
+    
+    def get_catalog_index(self):
+        index = self._catalog_index
+        if index is None:
+            try:
+                index = CatalogIndex.open(self.games_index_file, self.writer)
+            except Exception:
+                return None
+            self._catalog_index = index
+        return index
+    
+    def is_catalog_loaded(self):
+        with self._catalog_lock:
+            return self._catalog is not None
+    
+    def _encode_catalog(self, catalog, last_update):
+        strings = []
+        string_ids = {}
+        records = []
+        for game in catalog.values():
+            record = dict(game)
+            tags = record.get('tags')
+            if isinstance(tags, list):
+                tag_ids = []
+                for tag in tags:
+                    if tag not in string_ids:
+                        string_ids[tag] = len(strings)
+                        strings.append(tag)
+                    tag_ids.append(string_ids[tag])
+                record['tags'] = tag_ids
+            records.append(record)
+        
+        body = marshal.dumps([strings, list(catalog.keys()), last_update, records], marshal.version)
+        payload = zlib.compress(body, 6)
+        header = struct.pack(CACHE_HEADER, CACHE_MAGIC, CACHE_VERSION, marshal.version, zlib.crc32(payload), len(payload))
+        return header + payload
+    
+    def _decode_catalog(self, raw):
+        header_size = struct.calcsize(CACHE_HEADER)
+        magic, version, marshal_version, checksum, length = struct.unpack_from(CACHE_HEADER, raw)
+        payload = raw[header_size:header_size + length]
+        if magic != CACHE_MAGIC or version != CACHE_VERSION or marshal_version > marshal.version:
+            raise ValueError("Formato de cache desconhecido")
+        if len(payload) != length or zlib.crc32(payload) != checksum:
+            raise ValueError("Cache corrompido")
+        
+        strings, keys, _, records = marshal.loads(zlib.decompress(payload))
+        for record in records:
+            tags = record.get('tags')
+            if isinstance(tags, list):
+                record['tags'] = [strings[i] for i in tags]
+        return dict(zip(keys, records))
     
     def _get_cached_games(self):
+        catalog = self._get_cached_catalog()
+        return list(catalog.values()) if catalog else []
+    
+    def _get_cached_catalog(self):
+        if self.cache_format == "binary":
+            try:
+                return self._decode_catalog(self.writer.read_bytes(self.games_cache_bin_file))
+            except Exception:
+                pass
+        
+        catalog = self._get_cached_catalog_json()
+        if catalog is not None and self.cache_format == "binary":
+            self._save_cache(catalog, self._catalog_etag, 0)
+            self.writer.remove(self.games_cache_file)
+        return catalog
+    
+    def _get_cached_catalog_json(self):
         try:
-            if os.path.exists(self.games_cache_file):
-                with open(self.games_cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                return data.get("games", [])
-            return []
+            data = self.writer.read_json(self.games_cache_file)
+            games = data.get("games", [])
+            keys = data.get("keys") or [self._generate_game_id(g['nome']) for g in games]
+            return dict(zip(keys, games))
         except Exception:
-            return []
+            return None
     
     def _update_local_cache(self):
         try:
-            response = requests.get(
-                f"{FIREBASE_URL}games.json",
-                timeout=10
-            )
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    self._save_cache(list(data.values()))
+            self._fetch_catalog()
         except Exception:
             pass
     
-    def add_comment(self, game_name, username, comment_text):
+    def _generate_push_id(self):
+        with self._push_lock:
+            now = max(int(time.time() * 1000), self._last_push_time)
+            if now == self._last_push_time:
+                for i in range(11, -1, -1):
+                    if self._last_push_rand[i] != 63:
+                        self._last_push_rand[i] += 1
+                        break
+                    self._last_push_rand[i] = 0
+            else:
+                self._last_push_rand = [random.randrange(64) for _ in range(12)]
+            self._last_push_time = now
+            rand = list(self._last_push_rand)
+        return self._encode_push_id(now, rand)
+    
+    @staticmethod
+    def _encode_push_id(now, rand):
+        time_chars = []
+        for _ in range(8):
+            time_chars.append(PUSH_CHARS[now % 64])
+            now //= 64
+        return "".join(reversed(time_chars)) + "".join(PUSH_CHARS[i % 64] for i in rand)
+    
+    def _legacy_push_id(self, scope, index, entry):
         try:
-            game_key = self._generate_game_id(game_name)
-            
-            new_comment = {
+            stamp = int(datetime.strptime(entry.get('date', ''), "%d/%m/%Y %H:%M").timestamp() * 1000)
+        except Exception:
+            stamp = 0
+        seed = json.dumps([scope, index, entry], ensure_ascii=False, sort_keys=True, default=str)
+        digest = hashlib.sha1(seed.encode('utf-8')).digest()
+        order = [(index >> shift) & 63 for shift in (18, 12, 6, 0)]
+        return self._encode_push_id(max(stamp, 0), order + list(digest[:8]))
+    
+    def _normalize_comments(self, data):
+        if not isinstance(data, dict):
+            return []
+        
+        comments = []
+        for comment_id in sorted(data):
+            comment = data[comment_id]
+            if not isinstance(comment, dict) or 'user' not in comment:
+                continue
+            replies = comment.get('replies')
+            if not isinstance(replies, dict):
+                replies = {}
+            comments.append({
+                "id": comment_id,
+                "user": comment['user'],
+                "text": comment.get('text', ''),
+                "date": comment.get('date', ''),
+                "replies": [dict(replies[r], id=r) for r in sorted(replies) if isinstance(replies[r], dict)]
+            })
+        return comments
+    
+    def _comments_to_keyed(self, comments, scope):
+        keyed = {}
+        for index, comment in enumerate(comments):
+            if not isinstance(comment, dict):
+                continue
+            entry = {k: v for k, v in comment.items() if k not in ('id', 'replies')}
+            comment_id = self._legacy_push_id(scope, index, entry)
+            replies = {}
+            for reply_index, reply in enumerate(comment.get('replies') or []):
+                if isinstance(reply, dict):
+                    reply = {k: v for k, v in reply.items() if k != 'id'}
+                    replies[self._legacy_push_id(comment_id, reply_index, reply)] = reply
+            if replies:
+                entry['replies'] = replies
+            keyed[comment_id] = entry
+        return keyed
+    
+    def _split_legacy_comments(self, data):
+        if isinstance(data, list):
+            return data, {}
+        if isinstance(data, dict) and any(key.isdigit() for key in data):
+            legacy = [data[key] for key in sorted((k for k in data if k.isdigit()), key=int)]
+            return legacy, {k: v for k, v in data.items() if not k.isdigit()}
+        return None, data
+    
+    def _migrate_comments(self, game_key, comments, keyed_comments=None):
+        keyed = dict(keyed_comments or {})
+        keyed.update(self._comments_to_keyed(comments, game_key))
+        updates = {
+            f"comments/{game_key}": keyed,
+            f"comment_stats/{game_key}": self._count_comments(self._normalize_comments(keyed))
+        }
+        response = self._request('PATCH', "", json=updates)
+        if response.status_code == 200:
+            return keyed
+        return None
+    
+    def _count_comments(self, comments):
+        return {
+            "comments": len(comments),
+            "replies": sum(len(c.get('replies', [])) for c in comments)
+        }
+    
+    def _increment(self, amount):
+        return {".sv": {"increment": amount}}
+    
+    def _comment_updates(self, op):
+        base = f"comments/{op['game']}/{op['comment_id']}"
+        path = f"{base}/replies/{op['reply_id']}" if op.get('reply_id') else base
+        return {path: op.get('data')}
+    
+    def add_comment(self, game_name, username, comment_text):
+        op = {
+            "kind": "add_comment",
+            "game": self._generate_game_id(game_name),
+            "comment_id": self._generate_push_id(),
+            "data": {
                 "user": username,
                 "text": comment_text,
-                "date": datetime.now().strftime("%d/%m/%Y %H:%M"),
-                "replies": []
+                "date": datetime.now().strftime("%d/%m/%Y %H:%M")
             }
-            
-            response = requests.get(
-                f"{FIREBASE_URL}comments/{game_key}.json",
-                timeout=10
-            )
-            
-            comments = []
-            if response.status_code == 200 and response.json():
-                comments = response.json()
-                if not isinstance(comments, list):
-                    comments = []
-            
-            comments.append(new_comment)
-            
-            response = requests.put(
-                f"{FIREBASE_URL}comments/{game_key}.json",
-                json=comments,
-                timeout=10
-            )
+        }
+        try:
+            updates = self._comment_updates(op)
+            updates[f"comment_stats/{op['game']}/comments"] = self._increment(1)
+            response = self._request('PATCH', "", json=updates)
             
             if response.status_code == 200:
+                self._update_comment_cache(op)
                 return True, "Comentario adicionado!"
             return False, "Erro ao salvar comentario!"
             
         except Exception:
-            return self._add_comment_local(game_name, username, comment_text)
-    
-    def _add_comment_local(self, game_name, username, comment_text):
-        try:
-            with open(self.comments_file, 'r', encoding='utf-8') as f:
-                comments = json.load(f)
-        except Exception:
-            comments = {}
-        
-        game_key = game_name.lower().strip()
-        if game_key not in comments:
-            comments[game_key] = []
-        
-        new_comment = {
-            "user": username,
-            "text": comment_text,
-            "date": datetime.now().strftime("%d/%m/%Y %H:%M"),
-            "replies": []
-        }
-        comments[game_key].append(new_comment)
-        
-        with open(self.comments_file, 'w', encoding='utf-8') as f:
-            json.dump(comments, f, indent=4, ensure_ascii=False)
-        return True, "Comentario adicionado!"
+            self._queue_outbox(op)
+            self._update_comment_cache(op, pending=True)
+            return True, "Comentario adicionado!"
+    
+    def _fetch_comments(self, game_key):
+        return self._single_flight(("comments", game_key), partial(self._download_comments, game_key))
+    
+    def _download_comments(self, game_key):
+        response = self._request('GET', f"comments/{game_key}")
+        if response.status_code != 200:
+            return None
+        legacy, data = self._split_legacy_comments(response.json())
+        if legacy:
+            data = self._migrate_comments(game_key, legacy, data)
+        return self._normalize_comments(data)
     
     def get_comments(self, game_name):
+        game_key = self._generate_game_id(game_name)
+        cached = self.comment_cache.get(game_key, "comments")
+        if cached is not None:
+            return cached
+        
         try:
-            game_key = self._generate_game_id(game_name)
-            
-            response = requests.get(
-                f"{FIREBASE_URL}comments/{game_key}.json",
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data and isinstance(data, list):
-                    return data
+            comments = self._fetch_comments(game_key)
+            if comments is not None:
+                comments = self._apply_pending(game_key, comments)
+                self.comment_cache.put(game_key, "comments", comments)
+                return comments
             return self._get_comments_local(game_name)
             
         except Exception:
             return self._get_comments_local(game_name)
     
-    def _get_comments_local(self, game_name):
+    def get_comments_page(self, game_name, before=None, page_size=COMMENTS_PAGE_SIZE):
+        game_key = self._generate_game_id(game_name)
+        if before is None:
+            cached = self.comment_cache.get(game_key, ("page", page_size))
+            if cached is not None:
+                return cached
+        
         try:
-            with open(self.comments_file, 'r', encoding='utf-8') as f:
-                comments = json.load(f)
-            game_key = game_name.lower().strip()
-            return comments.get(game_key, [])
+            page = self._single_flight(
+                ("comments_page", game_key, before, page_size),
+                partial(self._fetch_comments_page, game_key, game_name, before, page_size)
+            )
         except Exception:
-            return []
+            page = None
+        
+        if page is None:
+            return self._slice_comments_page(self._get_comments_local(game_name), before, page_size)
+        if before is None:
+            self.comment_cache.put(game_key, ("page", page_size), page)
+        return page
     
-    def delete_comment(self, game_name, comment_index):
+    def _fetch_comments_page(self, game_key, game_name, before, page_size):
+        params = {'orderBy': '"$key"', 'limitToLast': page_size + (2 if before else 1)}
+        if before:
+            params['endAt'] = json.dumps(before)
+        response = self._request('GET', f"comments/{game_key}", params=params)
+        
+        if response.status_code != 200:
+            return None
+        data = response.json()
+        if self._split_legacy_comments(data)[0]:
+            self.comment_cache.invalidate(game_key)
+            return self._slice_comments_page(self.get_comments(game_name), before, page_size)
+        if isinstance(data, dict):
+            data.pop(before, None)
+            comments = self._normalize_comments(data)
+            lower_bound = comments[0]['id'] if len(comments) > page_size else None
+            comments = self._apply_pending(game_key, comments, lower_bound, before)
+            return self._slice_comments_page(comments, None, page_size)
+        return self._slice_comments_page(self._apply_pending(game_key, [], None, before), None, page_size)
+    
+    def _slice_comments_page(self, comments, before, page_size):
+        if before:
+            comments = [c for c in comments if c['id'] < before]
+        page = comments[-page_size:]
+        cursor = page[0]['id'] if len(comments) > page_size else None
+        return list(reversed(page)), cursor
+    
+    def get_comment_stats(self, game_name):
+        game_key = self._generate_game_id(game_name)
+        cached = self.comment_cache.get(game_key, "stats") or self._stats_from_summary(game_key)
+        if cached is not None:
+            return cached
+        
         try:
-            game_key = self._generate_game_id(game_name)
+            response = self._request('GET', f"comment_stats/{game_key}")
             
-            response = requests.get(
-                f"{FIREBASE_URL}comments/{game_key}.json",
-                timeout=10
-            )
+            if response.status_code == 200:
+                stats = self._with_pending_stats(game_key, response.json() or {})
+                self.comment_cache.put(game_key, "stats", stats)
+                return stats
+            return self._get_comment_stats_local(game_name)
             
-            if response.status_code == 200 and response.json():
-                comments = response.json()
-                if isinstance(comments, list) and 0 <= comment_index < len(comments):
-                    comments.pop(comment_index)
-                    
-                    requests.put(
-                        f"{FIREBASE_URL}comments/{game_key}.json",
-                        json=comments,
-                        timeout=10
-                    )
-                    return True
-            return False
         except Exception:
-            return self._delete_comment_local(game_name, comment_index)
+            return self._get_comment_stats_local(game_name)
     
-    def _delete_comment_local(self, game_name, comment_index):
-        try:
-            with open(self.comments_file, 'r', encoding='utf-8') as f:
-                comments = json.load(f)
-            game_key = game_name.lower().strip()
-            if game_key in comments and 0 <= comment_index < len(comments[game_key]):
-                comments[game_key].pop(comment_index)
-                with open(self.comments_file, 'w', encoding='utf-8') as f:
-                    json.dump(comments, f, indent=4, ensure_ascii=False)
-                return True
-            return False
-        except Exception:
-            return False
+    def _with_pending_stats(self, game_key, stats):
+        pending_comments, pending_replies = self._pending_stats_delta(game_key)
+        return (max(stats.get("comments", 0) + pending_comments, 0),
+                max(stats.get("replies", 0) + pending_replies, 0))
+    
+    def _stats_from_summary(self, game_key):
+        summary, stamp = self._comment_summary, self._comment_summary_time
+        if summary is None or time.monotonic() - stamp >= self.comment_cache.ttl:
+            return None
+        stats = self._with_pending_stats(game_key, summary.get(game_key) or {})
+        self.comment_cache.put(game_key, "stats", stats, stamp)
+        return stats
     
-    def add_reply(self, game_name, comment_index, username, reply_text):
+    def _update_comment_cache(self, op, pending=False):
+        kind = op['kind']
+        marker = {"pending": True} if pending else {}
+        removed_replies = []
+        
+        def change_comments(comments, newest_first):
+            if kind == 'add_comment':
+                comments = [c for c in comments if c['id'] != op['comment_id']]
+                comments.append(dict(op['data'], id=op['comment_id'], replies=[], **marker))
+                return sorted(comments, key=lambda c: c['id'], reverse=newest_first)
+            if kind == 'delete_comment':
+                removed_replies.extend(len(c['replies']) for c in comments if c['id'] == op['comment_id'])
+                return [c for c in comments if c['id'] != op['comment_id']]
+            
+            result = []
+            for comment in comments:
+                if comment['id'] == op['comment_id']:
+                    replies = [r for r in comment['replies'] if r['id'] != op['reply_id']]
+                    if kind == 'add_reply':
+                        replies.append(dict(op['data'], id=op['reply_id'], **marker))
+                    comment = dict(comment, replies=sorted(replies, key=lambda r: r['id']))
+                result.append(comment)
+            return result
+        
+        def change_stats(stats):
+            comments, replies = stats
+            if kind == 'add_comment':
+                return comments + 1, replies
+            if kind == 'add_reply':
+                return comments, replies + 1
+            if kind == 'delete_reply':
+                return comments, max(replies - 1, 0)
+            if not removed_replies:
+                return None
+            return max(comments - 1, 0), max(replies - removed_replies[0], 0)
+        
+        def change_lists(field, value):
+            if field == "stats":
+                return value
+            if field == "comments":
+                return change_comments(value, False)
+            page, cursor = value
+            return change_comments(page, True), cursor
+        
+        game_key = op['game']
+        if self.comment_cache.get(game_key, "stats") is None:
+            self._stats_from_summary(game_key)
+        self.comment_cache.update(game_key, change_lists)
+        self.comment_cache.update(game_key, lambda field, value: change_stats(value) if field == "stats" else value)
+    
+    def _get_comment_stats_local(self, game_name):
+        stats = self._count_comments(self._get_comments_local(game_name))
+        return stats["comments"], stats["replies"]
+    
+    def get_comments_summary(self, games):
         try:
-            game_key = self._generate_game_id(game_name)
+            response = self._request('GET', "comment_stats")
             
-            response = requests.get(
-                f"{FIREBASE_URL}comments/{game_key}.json",
-                timeout=10
-            )
+            if response.status_code == 200:
+                data = response.json() or {}
+                self._comment_summary = data
+                self._comment_summary_time = time.monotonic()
+                summary = {}
+                for jogo in games:
+                    game_key = self._generate_game_id(jogo['nome'])
+                    stats = data.get(game_key) or {}
+                    pending_comments = self._pending_stats_delta(game_key)[0]
+                    summary[jogo['nome']] = max(stats.get("comments", 0) + pending_comments, 0)
+                return summary
+            return self._get_comments_summary_local(games)
             
-            if response.status_code == 200 and response.json():
-                comments = response.json()
-                if isinstance(comments, list) and 0 <= comment_index < len(comments):
-                    if "replies" not in comments[comment_index]:
-                        comments[comment_index]["replies"] = []
-                    
-                    new_reply = {
-                        "user": username,
-                        "text": reply_text,
-                        "date": datetime.now().strftime("%d/%m/%Y %H:%M")
-                    }
-                    comments[comment_index]["replies"].append(new_reply)
-                    
-                    requests.put(
-                        f"{FIREBASE_URL}comments/{game_key}.json",
-                        json=comments,
-                        timeout=10
-                    )
-                    return True, "Resposta adicionada!"
-            return False, "Comentario não encontrado!"
         except Exception:
-            return self._add_reply_local(game_name, comment_index, username, reply_text)
+            return self._get_comments_summary_local(games)
+    
+    def _get_comments_summary_local(self, games):
+        return {jogo['nome']: self._get_comment_stats_local(jogo['nome'])[0] for jogo in games}
+    
+    def _get_comments_local(self, game_name):
+        return self._apply_pending(self._generate_game_id(game_name), [])
     
-    def _add_reply_local(self, game_name, comment_index, username, reply_text):
+    def delete_comment(self, game_name, comment_id):
+        op = {"kind": "delete_comment", "game": self._generate_game_id(game_name), "comment_id": comment_id}
         try:
-            with open(self.comments_file, 'r', encoding='utf-8') as f:
-                comments = json.load(f)
+            response = self._request('GET', f"comments/{op['game']}/{comment_id}")
+            comment = response.json() if response.status_code == 200 else None
+            if not isinstance(comment, dict):
+                return self._cancel_pending_cached(op)
+            
+            replies = comment.get("replies")
+            updates = self._comment_updates(op)
+            updates[f"comment_stats/{op['game']}/comments"] = self._increment(-1)
+            updates[f"comment_stats/{op['game']}/replies"] = self._increment(-len(replies) if isinstance(replies, dict) else 0)
+            response = self._request('PATCH', "", json=updates)
+            if response.status_code != 200:
+                return False
+            self._update_comment_cache(op)
+            return True
         except Exception:
-            comments = {}
-        
-        game_key = game_name.lower().strip()
-        if game_key not in comments:
-            return False, "Comentario não encontrado!"
-        if comment_index < 0 or comment_index >= len(comments[game_key]):
-            return False, "Comentario não encontrado!"
-        
-        if "replies" not in comments[game_key][comment_index]:
-            comments[game_key][comment_index]["replies"] = []
-        
-        new_reply = {
-            "user": username,
-            "text": reply_text,
-            "date": datetime.now().strftime("%d/%m/%Y %H:%M")
+            self._queue_outbox(op)
+            self._update_comment_cache(op, pending=True)
+            return True
+    
+    def add_reply(self, game_name, comment_id, username, reply_text):
+        op = {
+            "kind": "add_reply",
+            "game": self._generate_game_id(game_name),
+            "comment_id": comment_id,
+            "reply_id": self._generate_push_id(),
+            "data": {
+                "user": username,
+                "text": reply_text,
+                "date": datetime.now().strftime("%d/%m/%Y %H:%M")
+            }
         }
-        comments[game_key][comment_index]["replies"].append(new_reply)
-        
-        with open(self.comments_file, 'w', encoding='utf-8') as f:
-            json.dump(comments, f, indent=4, ensure_ascii=False)
-        return True, "Resposta adicionada!"
+        try:
+            response = self._request('GET', f"comments/{op['game']}/{comment_id}/user")
+            if response.status_code != 200 or not response.json():
+                if not self._has_pending_comment(op['game'], comment_id):
+                    return False, "Comentario não encontrado!"
+                self._queue_outbox(op)
+                self._update_comment_cache(op, pending=True)
+                return True, "Resposta adicionada!"
+            
+            updates = self._comment_updates(op)
+            updates[f"comment_stats/{op['game']}/replies"] = self._increment(1)
+            response = self._request('PATCH', "", json=updates)
+            if response.status_code == 200:
+                self._update_comment_cache(op)
+                return True, "Resposta adicionada!"
+            return False, "Erro ao salvar resposta!"
+        except Exception:
+            self._queue_outbox(op)
+            self._update_comment_cache(op, pending=True)
+            return True, "Resposta adicionada!"
     
-    def delete_reply(self, game_name, comment_index, reply_index):
+    def delete_reply(self, game_name, comment_id, reply_id):
+        op = {
+            "kind": "delete_reply",
+            "game": self._generate_game_id(game_name),
+            "comment_id": comment_id,
+            "reply_id": reply_id
+        }
         try:
-            game_key = self._generate_game_id(game_name)
+            reply_path = f"comments/{op['game']}/{comment_id}/replies/{reply_id}"
             
-            response = requests.get(
-                f"{FIREBASE_URL}comments/{game_key}.json",
-                timeout=10
-            )
+            response = self._request('GET', f"{reply_path}/user")
+            if response.status_code != 200 or not response.json():
+                return self._cancel_pending_cached(op)
             
-            if response.status_code == 200 and response.json():
-                comments = response.json()
-                if isinstance(comments, list):
-                    if 0 <= comment_index < len(comments):
-                        if "replies" in comments[comment_index]:
-                            if 0 <= reply_index < len(comments[comment_index]["replies"]):
-                                comments[comment_index]["replies"].pop(reply_index)
-                                requests.put(
-                                    f"{FIREBASE_URL}comments/{game_key}.json",
-                                    json=comments,
-                                    timeout=10
-                                )
-                                return True
-            return False
+            updates = self._comment_updates(op)
+            updates[f"comment_stats/{op['game']}/replies"] = self._increment(-1)
+            response = self._request('PATCH', "", json=updates)
+            if response.status_code != 200:
+                return False
+            self._update_comment_cache(op)
+            return True
         except Exception:
-            return self._delete_reply_local(game_name, comment_index, reply_index)
+            self._queue_outbox(op)
+            self._update_comment_cache(op, pending=True)
+            return True
     
-    def _delete_reply_local(self, game_name, comment_index, reply_index):
-        try:
-            with open(self.comments_file, 'r', encoding='utf-8') as f:
-                comments = json.load(f)
-            game_key = game_name.lower().strip()
-            if game_key in comments:
-                if 0 <= comment_index < len(comments[game_key]):
-                    if "replies" in comments[game_key][comment_index]:
-                        if 0 <= reply_index < len(comments[game_key][comment_index]["replies"]):
-                            comments[game_key][comment_index]["replies"].pop(reply_index)
-                            with open(self.comments_file, 'w', encoding='utf-8') as f:
-                                json.dump(comments, f, indent=4, ensure_ascii=False)
-                            return True
+    def _load_outbox(self):
+        return list(self._outbox)
+    
+    def _save_outbox(self, ops):
+        current_ids = set(o['id'] for o in self._outbox)
+        new_ids = set(o['id'] for o in ops)
+        added = [o for o in ops if o['id'] not in current_ids]
+        self.store.save_outbox(ops, added, current_ids - new_ids)
+        self._outbox = list(ops)
+        self._outbox_pending = len(ops)
+    
+    def _same_target(self, op, other):
+        if op['game'] != other['game'] or op['comment_id'] != other['comment_id']:
             return False
-        except Exception:
+        return op['kind'] == 'delete_comment' or op.get('reply_id') == other.get('reply_id')
+    
+    def _queue_outbox(self, op):
+        op = dict(op, id=self._generate_push_id(), created_at=datetime.now().strftime("%d/%m/%Y %H:%M"))
+        
+        with self._outbox_lock:
+            ops = self._load_outbox()
+            if op['kind'] in ('delete_comment', 'delete_reply'):
+                add_kind = 'add_comment' if op['kind'] == 'delete_comment' else 'add_reply'
+                pending_add = any(o['kind'] == add_kind and self._same_target(op, o) for o in ops)
+                ops = [o for o in ops if not self._same_target(op, o)]
+                if not pending_add:
+                    ops.append(op)
+            elif any(o['kind'] == op['kind'] and self._same_target(op, o) for o in ops):
+                return
+            else:
+                ops.append(op)
+            self._save_outbox(ops)
+    
+    def _cancel_pending(self, op):
+        with self._outbox_lock:
+            ops = self._load_outbox()
+            remaining = [o for o in ops if not self._same_target(op, o)]
+            if len(remaining) == len(ops):
+                return False
+            self._save_outbox(remaining)
+            return True
+    
+    def _cancel_pending_cached(self, op):
+        if not self._cancel_pending(op):
             return False
+        self._update_comment_cache(op)
+        return True
+    
+    def _has_pending_comment(self, game_key, comment_id):
+        return any(
+            o['kind'] == 'add_comment' and o['game'] == game_key and o['comment_id'] == comment_id
+            for o in self._load_outbox()
+        )
+    
+    def _apply_pending(self, game_key, comments, lower_bound=None, upper_bound=None):
+        ops = [o for o in self._load_outbox() if o['game'] == game_key]
+        if not ops:
+            return comments
+        
+        by_id = {c['id']: dict(c, replies=list(c['replies'])) for c in comments}
+        for op in ops:
+            comment_id = op['comment_id']
+            if op['kind'] == 'add_comment':
+                if (lower_bound is None or comment_id >= lower_bound) and (upper_bound is None or comment_id < upper_bound):
+                    by_id[comment_id] = dict(op['data'], id=comment_id, replies=[], pending=True)
+            elif op['kind'] == 'delete_comment':
+                by_id.pop(comment_id, None)
+            elif comment_id in by_id:
+                replies = [r for r in by_id[comment_id]['replies'] if r['id'] != op['reply_id']]
+                if op['kind'] == 'add_reply':
+                    replies.append(dict(op['data'], id=op['reply_id'], pending=True))
+                by_id[comment_id]['replies'] = sorted(replies, key=lambda r: r['id'])
+        return [by_id[k] for k in sorted(by_id)]
+    
+    def _pending_stats_delta(self, game_key):
+        pending_comments = 0
+        pending_replies = 0
+        for op in self._load_outbox():
+            if op['game'] != game_key:
+                continue
+            if op['kind'] == 'add_comment':
+                pending_comments += 1
+            elif op['kind'] == 'delete_comment':
+                pending_comments -= 1
+            elif op['kind'] == 'add_reply':
+                pending_replies += 1
+            else:
+                pending_replies -= 1
+        return pending_comments, pending_replies
+    
+    def _merge_update(self, updates, path, value):
+        for existing in list(updates):
+            if path.startswith(existing + "/") and isinstance(updates[existing], dict):
+                self._set_nested(updates[existing], path[len(existing) + 1:].split("/"), value)
+                return
+            if existing.startswith(path + "/"):
+                del updates[existing]
+        updates[path] = value
+    
+    def pending_outbox_count(self):
+        return self._outbox_pending
+    
+    def _schedule_outbox_replay(self):
+        if self._outbox_pending and not self._replaying and time.monotonic() >= self._next_replay_at:
+            threading.Thread(target=self.replay_outbox, daemon=True).start()
+    
+    def replay_outbox(self, on_progress=None):
+        with self._outbox_lock:
+            if self._replaying:
+                return 0, self._outbox_pending
+            self._replaying = True
+        
+        try:
+            return self._replay_outbox(on_progress)
+        finally:
+            self._replaying = False
+    
+    def _replay_outbox(self, on_progress):
+        ops = self._load_outbox()
+        total = len(ops)
+        done = 0
+        
+        for start in range(0, total, OUTBOX_BATCH_SIZE):
+            batch = ops[start:start + OUTBOX_BATCH_SIZE]
+            games = sorted(set(op['game'] for op in batch))
+            try:
+                remote = {game_key: self._remote_comment_keys(game_key) for game_key in games}
+                
+                updates = {}
+                counters = {}
+                for op in batch:
+                    deltas = self._replay_deltas(op, remote[op['game']])
+                    if deltas is None:
+                        continue
+                    for path, value in self._comment_updates(op).items():
+                        self._merge_update(updates, path, json.loads(json.dumps(value)))
+                    for field, amount in deltas.items():
+                        path = f"comment_stats/{op['game']}/{field}"
+                        counters[path] = counters.get(path, 0) + amount
+                for path, amount in counters.items():
+                    if amount:
+                        updates[path] = self._increment(amount)
+                
+                if updates:
+                    response = self._request('PATCH', "", json=updates)
+                    if response.status_code != 200:
+                        self._next_replay_at = time.monotonic() + OUTBOX_RETRY_DELAY
+                        break
+                
+                with self._outbox_lock:
+                    replayed = set(op['id'] for op in batch)
+                    self._save_outbox([o for o in self._load_outbox() if o['id'] not in replayed])
+                
+                for game_key in games:
+                    self.comment_cache.invalidate(game_key)
+            except Exception:
+                self._next_replay_at = time.monotonic() + OUTBOX_RETRY_DELAY
+                break
+            
+            done += len(batch)
+            for listener in [on_progress] + self.outbox_listeners:
+                if listener:
+                    listener(done, total)
+        
+        return done, total
+    
+    def _shallow_get(self, path):
+        response = self._request('GET', path, params={'shallow': 'true'})
+        if response.status_code != 200:
+            raise requests.exceptions.HTTPError(f"HTTP {response.status_code}")
+        return response.json()
+    
+    def _remote_comment_keys(self, game_key):
+        keys = self._shallow_get(f"comments/{game_key}")
+        if self._split_legacy_comments(keys)[0]:
+            self._fetch_comments(game_key)
+            keys = self._shallow_get(f"comments/{game_key}")
+            if self._split_legacy_comments(keys)[0]:
+                raise requests.exceptions.HTTPError("Comentarios antigos nao migrados")
+        return {comment_id: None for comment_id in (keys or {})}
+    
+    def _remote_replies(self, op, comments):
+        replies = comments.get(op['comment_id'])
+        if replies is None:
+            replies = self._shallow_get(f"comments/{op['game']}/{op['comment_id']}/replies")
+            replies = replies if isinstance(replies, dict) else {}
+            comments[op['comment_id']] = replies
+        return replies
+    
+    def _replay_deltas(self, op, comments):
+        kind = op['kind']
+        exists = op['comment_id'] in comments
+        if kind == 'add_comment':
+            return None if exists else {"comments": 1}
+        if kind == 'delete_comment':
+            return {"comments": -1, "replies": -len(self._remote_replies(op, comments))} if exists else None
+        
+        found = exists and op['reply_id'] in self._remote_replies(op, comments)
+        if kind == 'add_reply':
+            return None if found else {"replies": 1}
+        return {"replies": -1} if found else None
+    
+    def _migrate_local_comments(self):
+        try:
+            legacy = self.writer.read_json(self.comments_file)
+        except Exception:
+            return
+        if not legacy:
+            return
+        
+        for legacy_key, game_comments in legacy.items():
+            game_key = self._generate_game_id(legacy_key)
+            if isinstance(game_comments, list):
+                game_comments = self._comments_to_keyed(game_comments, "local:" + game_key)
+            for comment in self._normalize_comments(game_comments):
+                data = {k: v for k, v in comment.items() if k not in ('id', 'replies')}
+                self._queue_outbox({"kind": "add_comment", "game": game_key, "comment_id": comment['id'], "data": data})
+                for reply in comment['replies']:
+                    self._queue_outbox({
+                        "kind": "add_reply",
+                        "game": game_key,
+                        "comment_id": comment['id'],
+                        "reply_id": reply['id'],
+                        "data": {k: v for k, v in reply.items() if k != 'id'}
+                    })
+        
+        self.writer.write_json(self.comments_file, {})
+        self.writer.flush()
     
     def save_login(self, username, password):
         try:
             data = {"username": username, "password": password, "saved": True}
-            with open(self.saved_login_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            self.writer.write_json(self.saved_login_file, data)
             return True
         except Exception:
             return False
     
     def get_saved_login(self):
         try:
-            if os.path.exists(self.saved_login_file):
-                with open(self.saved_login_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                if data.get("saved", False):
-                    return data.get("username", ""), data.get("password", "")
+            data = self.writer.read_json(self.saved_login_file)
+            if data.get("saved", False):
+                return data.get("username", ""), data.get("password", "")
             return None, None
         except Exception:
             return None, None
     
     def clear_saved_login(self):
         try:
-            if os.path.exists(self.saved_login_file):
-                os.remove(self.saved_login_file)
+            self.writer.remove(self.saved_login_file)
             return True
         except Exception:
             return False
     
     def is_admin(self, username):
         try:
-            with open(self.admin_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return username.lower() in [a.lower() for a in data.get("admins", [])]
+            return username.casefold() in self._get_admin_set()
         except Exception:
             return False
     
+    def _get_admin_set(self):
+        version = self.store.admin_version()
+        with self._admin_lock:
+            if self._admin_set is None or version != self._admin_version:
+                self._admin_set = {a.casefold() for a in self.store.get_admins()}
+                self._admin_version = version
+            return self._admin_set
+    
+    def _invalidate_admins(self):
+        with self._admin_lock:
+            self._admin_set = None
+    
     def make_admin(self, username, secret_key):
         try:
             decoded_key = base64.b64decode(ADMIN_KEY_ENCODED).decode('utf-8')
@@ -474,74 +2486,284 @@ class Database:
         if secret_key != decoded_key:
             return False, "Senha admin incorreta!"
         
-        try:
-            with open(self.admin_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except Exception:
-            data = {"admins": []}
-        
-        if username.lower() in [a.lower() for a in data.get("admins", [])]:
+        added = self.store.add_admin(username)
+        self._invalidate_admins()
+        if not added:
             return False, "Usuario ja é um administrador!"
-        
-        data["admins"].append(username)
-        with open(self.admin_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
         return True, "Você agora é um administrador!"
     
     def remove_admin(self, username):
         try:
-            with open(self.admin_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            data["admins"] = [a for a in data["admins"] if a.lower() != username.lower()]
-            with open(self.admin_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            self.store.remove_admin(username)
+            self._invalidate_admins()
             return True
         except Exception:
             return False
     
     def register_user(self, username, password):
         try:
-            with open(self.users_file, 'r', encoding='utf-8') as f:
-                users = json.load(f)
+            existing, _ = self.store.find_user(username)
         except Exception:
-            users = {}
+            existing = None
         
-        if username.lower() in [u.lower() for u in users.keys()]:
+        if existing:
             return False, "Usuario ja existe!"
         if len(username) < 3:
             return False, "Usuario deve ter pelo menos 3 caracteres!"
         if len(password) < 4:
             return False, "Senha deve ter pelo menos 4 caracteres!"
         
-        users[username] = {
+        record = {
             "password": self._hash_password(password),
             "created_at": datetime.now().strftime("%d/%m/%Y %H:%M")
         }
-        with open(self.users_file, 'w', encoding='utf-8') as f:
-            json.dump(users, f, indent=4, ensure_ascii=False)
+        if not self.store.add_user(username, record):
+            return False, "Usuario ja existe!"
         return True, "Conta criada com sucesso!"
     
     def login_user(self, username, password):
         try:
-            with open(self.users_file, 'r', encoding='utf-8') as f:
-                users = json.load(f)
+            real_username, record = self.store.find_user(username)
         except Exception:
             return False, "Erro ao acessar banco de dados!"
         
-        real_username = None
-        for u in users.keys():
-            if u.lower() == username.lower():
-                real_username = u
-                break
-        
         if not real_username:
             return False, "Usuario não encontrado!"
-        if users[real_username]["password"] != self._hash_password(password):
+        if record["password"] != self._hash_password(password):
             return False, "Senha incorreta!"
         return True, real_username
 
 
+class CatalogSync:
+    def __init__(self, database, max_backoff=LIVE_SYNC_MAX_BACKOFF):
+        self.db = database
+        self.max_backoff = max_backoff
+        self.listeners = []
+        self.connected = False
+        self._response = None
+        self._stop_event = threading.Event()
+        self._thread = None
+    
+    def add_listener(self, listener):
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+    
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stop_event.set()
+        response = self._response
+        if response is not None:
+            try:
+                response.close()
+            except Exception:
+                pass
+    
+    def _run(self):
+        backoff = 1
+        while not self._stop_event.is_set():
+            try:
+                self._response = self.db._request(
+                    'GET',
+                    "games",
+                    headers={'Accept': 'text/event-stream', 'Accept-Encoding': 'identity'},
+                    stream=True,
+                    timeout=(self.db.timeout[0], LIVE_SYNC_READ_TIMEOUT)
+                )
+                if self._response.status_code == 200:
+                    for event in self._read_events(self._response):
+                        backoff = 1
+                        if not self._handle_event(*event):
+                            return
+            except Exception:
+                pass
+            finally:
+                self.connected = False
+                if self._response is not None:
+                    self._response.close()
+                    self._response = None
+            
+            self._stop_event.wait(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+    
+    def _iter_lines(self, response):
+        read = getattr(response.raw, 'read1', None) or (lambda amt: response.raw.read(1))
+        buffer = bytearray()
+        while not self._stop_event.is_set():
+            chunk = read(8192)
+            if not chunk:
+                return
+            start = len(buffer)
+            buffer.extend(chunk)
+            end = buffer.find(b"\n", start)
+            while end != -1:
+                yield bytes(buffer[:end]).rstrip(b"\r").decode('utf-8')
+                del buffer[:end + 1]
+                end = buffer.find(b"\n")
+    
+    def _read_events(self, response):
+        event = None
+        data_lines = []
+        for line in self._iter_lines(response):
+            if line == "":
+                if event:
+                    yield event, "\n".join(data_lines)
+                event = None
+                data_lines = []
+            elif line.startswith('event:'):
+                event = line[6:].strip()
+            elif line.startswith('data:'):
+                data_lines.append(line[5:].strip())
+    
+    def _handle_event(self, event, raw_data):
+        self.connected = True
+        
+        if event == 'keep-alive':
+            self.db.touch_catalog()
+            return True
+        if event == 'cancel':
+            return False
+        if event not in ('put', 'patch'):
+            return True
+        
+        payload = json.loads(raw_data) if raw_data else None
+        if not isinstance(payload, dict):
+            return True
+        
+        path = payload.get('path', '/')
+        changes = self.db.apply_catalog_event(event, path, payload.get('data'))
+        if not changes:
+            return True
+        
+        if path == '/' and event == 'put':
+            changes = [('reset', None, None)]
+        for listener in list(self.listeners):
+            for kind, game, old_game in changes:
+                listener(kind, game, old_game)
+        return True
+
+
+class DetailsPrefetcher:
+    def __init__(self, database, max_workers=PREFETCH_MAX_WORKERS, max_images=PREFETCH_IMAGE_LIMIT,
+                 image_ttl=PREFETCH_IMAGE_TTL):
+        self.db = database
+        self.max_workers = max_workers
+        self.max_images = max_images
+        self.image_ttl = image_ttl
+        self._queue = []
+        self._wanted = set()
+        self._images = OrderedDict()
+        self._cond = threading.Condition()
+        self._workers = []
+    
+    def prefetch(self, games):
+        with self._cond:
+            self._queue = list(games)
+            self._wanted = set(g['nome'] for g in games)
+            self._workers = [w for w in self._workers if w.is_alive()]
+            while len(self._workers) < min(self.max_workers, len(self._queue)):
+                worker = threading.Thread(target=self._run, daemon=True)
+                worker.start()
+                self._workers.append(worker)
+            self._cond.notify_all()
+    
+    def cancel(self):
+        self.prefetch([])
+    
+    def warm_image(self, url):
+        if not url or not url.startswith('http'):
+            return
+        
+        now = time.monotonic()
+        warmed = self._images.get(url)
+        self._images[url] = warmed if warmed is not None and now - warmed < self.image_ttl else now
+        self._images.move_to_end(url)
+        while len(self._images) > self.max_images:
+            self._images.popitem(last=False)
+        if self._images[url] == now:
+            Loader.image(url)
+    
+    def _is_wanted(self, game):
+        with self._cond:
+            return game['nome'] in self._wanted
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._queue:
+                    return
+                game = self._queue.pop(0)
+            
+            try:
+                self.db.get_comment_stats(game['nome'])
+                if self._is_wanted(game):
+                    self.db.get_comments_page(game['nome'])
+            except Exception:
+                pass
+
+
+class SearchSession:
+    def __init__(self, database, limit=SEARCH_RESULT_LIMIT):
+        self.db = database
+        self.limit = limit
+        self.generation = 0
+        self._pending = None
+        self._state = None
+        self._cond = threading.Condition()
+        self._worker = None
+    
+    def submit(self, query, callback):
+        with self._cond:
+            self.generation += 1
+            self._pending = (self.generation, query, callback)
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+            self._cond.notify()
+            return self.generation
+    
+    def invalidate(self):
+        with self._cond:
+            self.generation += 1
+            self._pending = None
+            return self.generation
+    
+    def is_current(self, generation):
+        return generation == self.generation
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                generation, query, callback = self._pending
+                self._pending = None
+            
+            games, error = None, None
+            try:
+                if query.strip():
+                    games, self._state = self.db.refine_search(query, self.limit, self._state)
+                else:
+                    games = self.db.get_global_games(stale_ok=True)
+            except Exception as e:
+                self._state = None
+                error = e
+            
+            if self.is_current(generation):
+                callback(generation, query, games, error)
+
+
 db = Database()
+catalog_sync = CatalogSync(db)
 
 
 class MenuButton(Button):
@@ -820,9 +3042,8 @@ class GameCardWithImage(BoxLayout):
         )
         nome_label.bind(size=nome_label.setter('text_size'))
         
-        comments_text = f" [{comments_count}]" if comments_count > 0 else ""
-        info_label = Label(
-            text=f"PC Game{comments_text}",
+        self.info_label = Label(
+            text="",
             font_size=17,
             font_name='Roboto',
             color=(0.5, 0.5, 0.6, 1),
@@ -830,7 +3051,8 @@ class GameCardWithImage(BoxLayout):
             valign='middle',
             size_hint_y=0.25
         )
-        info_label.bind(size=info_label.setter('text_size'))
+        self.info_label.bind(size=self.info_label.setter('text_size'))
+        self.set_comments_count(comments_count)
         
         tags_box = BoxLayout(size_hint_y=0.25, spacing=8)
         tags = game_data.get('tags', [])[:3]
@@ -854,7 +3076,7 @@ class GameCardWithImage(BoxLayout):
             tags_box.add_widget(tag_label)
         
         info_container.add_widget(nome_label)
-        info_container.add_widget(info_label)
+        info_container.add_widget(self.info_label)
         info_container.add_widget(tags_box)
         
         self.add_widget(img_container)
@@ -862,6 +3084,10 @@ class GameCardWithImage(BoxLayout):
         
         self.bind(on_touch_down=self.on_touch_handler)
     
+    def set_comments_count(self, comments_count):
+        comments_text = f" [{comments_count}]" if comments_count > 0 else ""
+        self.info_label.text = f"PC Game{comments_text}"
+    
     def on_touch_handler(self, instance, touch):
         if self.collide_point(*touch.pos):
             self.on_click(self.game_data)
@@ -884,13 +3110,14 @@ class GameCardWithImage(BoxLayout):
 class AdminGameCardWithImage(BoxLayout):
     def __init__(self, game_data, on_open, on_delete, comments_count=0, **kwargs):
         super(AdminGameCardWithImage, self).__init__(**kwargs)
+        self.game_data = game_data
         self.orientation = 'horizontal'
         self.size_hint_y = None
         self.height = 160
         self.spacing = 12
         self.padding = [0, 0, 8, 0]
         
-        game_card = GameCardWithImage(
+        self.game_card = GameCardWithImage(
             game_data=game_data,
             on_click=on_open,
             comments_count=comments_count,
@@ -918,7 +3145,7 @@ class AdminGameCardWithImage(BoxLayout):
         btn_container.add_widget(btn_holder)
         btn_container.add_widget(Label(size_hint_y=0.3))
         
-        self.add_widget(game_card)
+        self.add_widget(self.game_card)
         self.add_widget(btn_container)
 
 
@@ -957,7 +3184,7 @@ class AlphabetHeader(BoxLayout):
 
 
 class ReplyCard(BoxLayout):
-    def __init__(self, reply_data, comment_index, reply_index, game_name, is_admin, on_delete, **kwargs):
+    def __init__(self, reply_data, comment_id, game_name, is_admin, on_delete, **kwargs):
         super(ReplyCard, self).__init__(**kwargs)
         self.orientation = 'vertical'
         self.size_hint_y = None
@@ -1024,7 +3251,7 @@ class ReplyCard(BoxLayout):
                 color=(1, 0.4, 0.4, 1)
             )
             del_btn.bind(pos=self._update_del_btn, size=self._update_del_btn)
-            del_btn.bind(on_release=lambda x: on_delete(game_name, comment_index, reply_index))
+            del_btn.bind(on_release=lambda x: on_delete(game_name, comment_id, reply_data['id']))
             self._del_btn = del_btn
             reply_box.add_widget(del_btn)
         
@@ -1048,7 +3275,7 @@ class ReplyCard(BoxLayout):
 
 
 class CommentCard(BoxLayout):
-    def __init__(self, comment_data, index, game_name, is_admin, on_delete, on_reply, on_delete_reply, **kwargs):
+    def __init__(self, comment_data, game_name, is_admin, on_delete, on_reply, on_delete_reply, **kwargs):
         super(CommentCard, self).__init__(**kwargs)
         self.orientation = 'vertical'
         self.size_hint_y = None
@@ -1117,7 +3344,7 @@ class CommentCard(BoxLayout):
             color=(1, 1, 1, 1)
         )
         reply_btn.bind(pos=self._update_reply_btn, size=self._update_reply_btn)
-        reply_btn.bind(on_release=lambda x: on_reply(game_name, index, comment_data['user']))
+        reply_btn.bind(on_release=lambda x: on_reply(game_name, comment_data['id'], comment_data['user']))
         self._reply_btn = reply_btn
         actions_box.add_widget(reply_btn)
         
@@ -1146,7 +3373,7 @@ class CommentCard(BoxLayout):
                 color=(1, 0.9, 0.9, 1)
             )
             del_btn.bind(pos=self._update_del_btn, size=self._update_del_btn)
-            del_btn.bind(on_release=lambda x: on_delete(game_name, index))
+            del_btn.bind(on_release=lambda x: on_delete(game_name, comment_data['id']))
             self._del_btn = del_btn
             actions_box.add_widget(del_btn)
         else:
@@ -1160,11 +3387,10 @@ class CommentCard(BoxLayout):
             separator = BoxLayout(size_hint_y=None, height=8)
             self.add_widget(separator)
             
-            for reply_idx, reply in enumerate(replies):
+            for reply in replies:
                 reply_card = ReplyCard(
                     reply_data=reply,
-                    comment_index=index,
-                    reply_index=reply_idx,
+                    comment_id=comment_data['id'],
                     game_name=game_name,
                     is_admin=is_admin,
                     on_delete=on_delete_reply
@@ -1599,6 +3825,7 @@ class GameDetailsScreen(Screen):
         self.current_game = None
         self.current_user = None
         self.is_admin = False
+        self.comments_cursor = None
         
         with self.canvas.before:
             Color(*COR_FUNDO_APP)
@@ -1729,6 +3956,9 @@ class GameDetailsScreen(Screen):
         self.comments_layout = BoxLayout(orientation='vertical', size_hint_y=None, spacing=14)
         self.comments_layout.bind(minimum_height=self.comments_layout.setter('height'))
         
+        self.btn_load_older = PurpleButton(text='Carregar comentarios antigos', size_hint_y=None, height=50, font_size=15)
+        self.btn_load_older.bind(on_release=self.load_older_comments)
+        
         self.scroll_content.add_widget(lbl_desc_title)
         self.scroll_content.add_widget(self.lbl_desc)
         self.scroll_content.add_widget(separator1)
@@ -1793,9 +4023,7 @@ class GameDetailsScreen(Screen):
             chip = CategoryChip(text=texto, size_hint=(None, None), size=(len(texto)*12 + 24, 30), color_bg=cor)
             self.tags_layout.add_widget(chip)
         
-        comments = db.get_comments(self.current_game)
-        total_replies = sum(len(c.get('replies', [])) for c in comments)
-        self.lbl_comments_title.text = f"[b]COMENTARIOS ({len(comments)}) - RESPOSTAS ({total_replies})[/b]"
+        self.update_comments_count()
         self.load_comments()
         
         self.btn_download.unbind(on_release=self.abrir_link)
@@ -1803,7 +4031,7 @@ class GameDetailsScreen(Screen):
     
     def load_comments(self):
         self.comments_layout.clear_widgets()
-        comments = db.get_comments(self.current_game)
+        comments, self.comments_cursor = db.get_comments_page(self.current_game)
         
         if not comments:
             no_comments = Label(
@@ -1818,18 +4046,31 @@ class GameDetailsScreen(Screen):
             no_comments.bind(size=no_comments.setter('text_size'))
             self.comments_layout.add_widget(no_comments)
         else:
-            for i, comment in enumerate(reversed(comments)):
-                real_index = len(comments) - 1 - i
-                card = CommentCard(
-                    comment_data=comment,
-                    index=real_index,
-                    game_name=self.current_game,
-                    is_admin=self.is_admin,
-                    on_delete=self.delete_comment,
-                    on_reply=self.show_reply_popup,
-                    on_delete_reply=self.delete_reply
-                )
-                self.comments_layout.add_widget(card)
+            self.add_comment_cards(comments)
+    
+    def load_older_comments(self, *args):
+        if not self.comments_cursor:
+            return
+        comments, self.comments_cursor = db.get_comments_page(self.current_game, before=self.comments_cursor)
+        self.add_comment_cards(comments)
+    
+    def add_comment_cards(self, comments):
+        if self.btn_load_older.parent:
+            self.comments_layout.remove_widget(self.btn_load_older)
+        
+        for comment in comments:
+            card = CommentCard(
+                comment_data=comment,
+                game_name=self.current_game,
+                is_admin=self.is_admin,
+                on_delete=self.delete_comment,
+                on_reply=self.show_reply_popup,
+                on_delete_reply=self.delete_reply
+            )
+            self.comments_layout.add_widget(card)
+        
+        if self.comments_cursor:
+            self.comments_layout.add_widget(self.btn_load_older)
     
     def send_comment(self, instance):
         comment_text = self.comment_input.text.strip().replace('\n', ' ')
@@ -1854,7 +4095,7 @@ class GameDetailsScreen(Screen):
             self.load_comments()
             self.update_comments_count()
     
-    def show_reply_popup(self, game_name, comment_index, original_user):
+    def show_reply_popup(self, game_name, comment_id, original_user):
         if not self.current_user:
             self.show_message("Você precisa estar logado para responder!")
             return
@@ -1914,7 +4155,7 @@ class GameDetailsScreen(Screen):
                 self.show_message("Resposta muito longa (max 300 caracteres)!")
                 return
             
-            success, message = db.add_reply(game_name, comment_index, self.current_user, reply_text)
+            success, message = db.add_reply(game_name, comment_id, self.current_user, reply_text)
             if success:
                 popup.dismiss()
                 self.load_comments()
@@ -1929,7 +4170,7 @@ class GameDetailsScreen(Screen):
         
         popup.open()
     
-    def delete_comment(self, game_name, index):
+    def delete_comment(self, game_name, comment_id):
         if not self.is_admin:
             return
         
@@ -1956,7 +4197,7 @@ class GameDetailsScreen(Screen):
         btn_cancel.bind(on_release=popup.dismiss)
         
         def confirm_delete(inst):
-            db.delete_comment(game_name, index)
+            db.delete_comment(game_name, comment_id)
             popup.dismiss()
             self.load_comments()
             self.update_comments_count()
@@ -1970,7 +4211,7 @@ class GameDetailsScreen(Screen):
         
         popup.open()
     
-    def delete_reply(self, game_name, comment_index, reply_index):
+    def delete_reply(self, game_name, comment_id, reply_id):
         if not self.is_admin:
             return
         
@@ -1997,7 +4238,7 @@ class GameDetailsScreen(Screen):
         btn_cancel.bind(on_release=popup.dismiss)
         
         def confirm_delete(inst):
-            db.delete_reply(game_name, comment_index, reply_index)
+            db.delete_reply(game_name, comment_id, reply_id)
             popup.dismiss()
             self.load_comments()
             self.update_comments_count()
@@ -2012,9 +4253,8 @@ class GameDetailsScreen(Screen):
         popup.open()
     
     def update_comments_count(self):
-        comments = db.get_comments(self.current_game)
-        total_replies = sum(len(c.get('replies', [])) for c in comments)
-        self.lbl_comments_title.text = f"[b]COMENTARIOS ({len(comments)}) - RESPOSTAS ({total_replies})[/b]"
+        total_comments, total_replies = db.get_comment_stats(self.current_game)
+        self.lbl_comments_title.text = f"[b]COMENTARIOS ({total_comments}) - RESPOSTAS ({total_replies})[/b]"
     
     def show_message(self, message):
         content = BoxLayout(orientation='vertical', spacing=18, padding=22)
@@ -2048,7 +4288,15 @@ class MainScreen(Screen):
         self.is_loading = False
         self.jogos_pendentes = []
         self.letra_separadora_atual = ""
+        self.agrupar_por_letra = True
         self._search_event = None
+        self._prefetch_event = None
+        self.prefetcher = DetailsPrefetcher(db)
+        self.search_session = SearchSession(db)
+        self.categorias_selecionadas = []
+        self.comments_counts = {}
+        self.cards_por_nome = {}
+        self.widgets_por_nome = {}
         
         self.main_container = FloatLayout(size_hint=(1, 1))
         with self.main_container.canvas.before:
@@ -2152,7 +4400,15 @@ class MainScreen(Screen):
         )
         self.search_input.bind(text=self.filtrar_jogos)
         search_box.add_widget(self.search_input)
-        self.content_layout.add_widget(search_box)
+        
+        search_area = BoxLayout(orientation='vertical', size_hint_y=None, spacing=6)
+        search_area.bind(minimum_height=search_area.setter('height'))
+        search_area.add_widget(search_box)
+        
+        self.suggestions_box = SearchContainer(orientation='vertical', size_hint_y=None, height=0, padding=[14, 0, 14, 0])
+        self.suggestions_box.opacity = 0
+        search_area.add_widget(self.suggestions_box)
+        self.content_layout.add_widget(search_area)
         
         scroll_cat = ScrollView(size_hint_y=None, height=55, do_scroll_x=True, do_scroll_y=False, bar_width=0)
         self.cat_layout = BoxLayout(orientation='horizontal', spacing=12, size_hint_x=None)
@@ -2184,11 +4440,13 @@ class MainScreen(Screen):
         
         self.banco_de_jogos = []
         self.lista_atual = []
+        self.lista_exibida = self.lista_atual
         
         self.scroll = ScrollView(bar_width=5, bar_color=COR_TEXTO_ROXO)
         self.list_layout = BoxLayout(orientation='vertical', size_hint_y=None, spacing=14, padding=[0, 12, 0, 0])
         self.list_layout.bind(minimum_height=self.list_layout.setter('height'))
         self.scroll.add_widget(self.list_layout)
+        self.scroll.bind(scroll_y=self.agendar_prefetch, height=self.agendar_prefetch)
         self.content_layout.add_widget(self.scroll)
         self.main_container.add_widget(self.content_layout)
         
@@ -2247,6 +4505,9 @@ class MainScreen(Screen):
         self.side_menu.add_widget(Label(text="pre alpha", size_hint_y=None, height=45, font_size=14, font_name='Roboto', color=(0.5, 0.5, 0.5, 1)))
         
         self.add_widget(self.main_container)
+        catalog_sync.add_listener(self.on_catalog_event)
+        db.outbox_listeners.append(self.on_outbox_progress)
+        db.circuit.listeners.append(self.on_circuit_change)
     
     def on_enter(self):
         if not MainScreen.ja_carregou or not self.list_layout.children:
@@ -2270,26 +4531,112 @@ class MainScreen(Screen):
         
         self.refresh_games_list()
     
-    def refresh_games_list(self):
+    def refresh_games_list(self, force=False):
         if self.is_loading:
             return
         
         self.is_loading = True
         self.loading_label.opacity = 1
         
+        indice = db.get_catalog_index() if not force and not db.is_catalog_loaded() else None
+        if indice is not None and len(indice):
+            self.atualizar_lista(self.banco_de_jogos + indice.games(0, 5))
+            
+            def load_snapshot_thread():
+                games = db.get_global_games(stale_ok=True, on_update=self.on_catalog_revalidated)
+                Clock.schedule_once(lambda dt: self.update_games_ui(games), 0)
+                self.carregar_contadores(games)
+            
+            threading.Thread(target=load_snapshot_thread, daemon=True).start()
+            return
+        
+        if not force:
+            games = db.get_global_games(stale_ok=True, on_update=self.on_catalog_revalidated)
+            if games:
+                self.update_games_ui(games)
+                threading.Thread(target=self.carregar_contadores, args=(games,), daemon=True).start()
+            return
+        
         def fetch_data_thread():
-            games = db.get_global_games()
-            for jogo in games:
-                db.get_comments(jogo['nome'])
+            games = db.get_global_games(force=True)
             Clock.schedule_once(lambda dt: self.update_games_ui(games), 0)
+            self.carregar_contadores(games)
         
         threading.Thread(target=fetch_data_thread, daemon=True).start()
     
+    def on_catalog_revalidated(self, games):
+        Clock.schedule_once(lambda dt: self.aplicar_catalogo_revalidado(games), 0)
+        self.carregar_contadores(games)
+    
+    def aplicar_catalogo_revalidado(self, games):
+        if self.lista_exibida is self.lista_atual:
+            self.update_games_ui(games)
+            return
+        
+        self.lista_atual = self.banco_de_jogos + games
+        self.loading_label.opacity = 0
+        self.is_loading = False
+    
+    def carregar_contadores(self, games):
+        counts = db.get_comments_summary(games)
+        Clock.schedule_once(lambda dt: self.atualizar_contadores(counts), 0)
+    
+    def atualizar_contadores(self, counts):
+        self.comments_counts = counts
+        for nome, card in self.cards_por_nome.items():
+            card.set_comments_count(counts.get(nome, 0))
+    
+    def on_catalog_event(self, kind, game, old_game):
+        Clock.schedule_once(partial(self.aplicar_evento_catalogo, kind, game, old_game), 0)
+    
+    def aplicar_evento_catalogo(self, kind, game, old_game, dt):
+        visao_completa = self.lista_exibida is self.lista_atual
+        games = db.get_global_games(stale_ok=True)
+        
+        if kind == 'reset' or not self.widgets_por_nome:
+            if visao_completa and not self.is_loading:
+                self.update_games_ui(games)
+                return
+            self.lista_atual = self.banco_de_jogos + games
+            if visao_completa:
+                self.lista_exibida = self.lista_atual
+            return
+        
+        self.lista_atual = self.banco_de_jogos + games
+        if visao_completa:
+            self.lista_exibida = self.lista_atual
+        
+        if old_game is not None and old_game['nome'] in self.widgets_por_nome:
+            if game is not None and game['nome'] == old_game['nome']:
+                self.substituir_card(game)
+                return
+            self.remover_card(old_game['nome'])
+        
+        if game is not None and visao_completa:
+            self.inserir_card(game)
+    
+    def on_circuit_change(self, old_state, new_state):
+        Clock.schedule_once(lambda dt: self.mostrar_conexao(new_state), 0)
+    
+    def mostrar_conexao(self, state):
+        if state == CircuitBreaker.CLOSED:
+            self.lbl_sub.text = 'Biblioteca de Jogos'
+        else:
+            self.lbl_sub.text = 'Modo offline - usando cache'
+    
+    def on_outbox_progress(self, done, total):
+        Clock.schedule_once(lambda dt: self.mostrar_sincronizacao(done, total), 0)
+    
+    def mostrar_sincronizacao(self, done, total):
+        self.lbl_sub.text = f'Comentarios sincronizados: {done}/{total}'
+        Clock.schedule_once(lambda dt: setattr(self.lbl_sub, 'text', 'Biblioteca de Jogos'), 3)
+    
     def update_games_ui(self, games):
         self.lista_atual = self.banco_de_jogos + games
         self.atualizar_lista(self.lista_atual)
         self.loading_label.opacity = 0
         self.is_loading = False
+        db.warm_suggestions()
     
     def show_add_game_popup(self, instance):
         if not self.current_user:
@@ -2481,7 +4828,11 @@ class MainScreen(Screen):
                     if success:
                         popup.dismiss()
                         self.show_message_popup("Sucesso", f"'{name}' adicionado ao catalogo!\n\nTodos os usuarios poderão ver este jogo.")
-                        self.refresh_games_list()
+                        jogo = db.get_catalog_game(name)
+                        if jogo is None:
+                            self.refresh_games_list()
+                        elif jogo['nome'] not in self.widgets_por_nome:
+                            self.aplicar_evento_catalogo('add', jogo, None, 0)
                     else:
                         btn_save.text = "SALVAR"
                         btn_save.disabled = False
@@ -2635,22 +4986,39 @@ class MainScreen(Screen):
         self.show_message_popup("Sucesso", "Jogo deletado do Firebase!")
     
     def filtrar_por_categoria(self, categoria, instance):
+        if categoria == "Todos":
+            self.categorias_selecionadas = []
+        elif categoria in self.categorias_selecionadas:
+            self.categorias_selecionadas.remove(categoria)
+        else:
+            self.categorias_selecionadas.append(categoria)
+        
+        selecionadas = list(self.categorias_selecionadas)
         for nome, btn in self.botoes_categoria.items():
-            btn.update_color(COR_BTN_ROXO if nome == categoria else COR_CHIP_OFF)
+            ativo = nome in selecionadas or (nome == "Todos" and not selecionadas)
+            btn.update_color(COR_BTN_ROXO if ativo else COR_CHIP_OFF)
+        
+        geracao = self.search_session.invalidate()
         
         def thread_de_processamento():
-            global_games = db.get_global_games()
-            todos_jogos = self.banco_de_jogos + global_games
-            
-            if categoria == "Todos":
-                filtrados = todos_jogos
-            else:
-                filtrados = [j for j in todos_jogos if categoria in j.get('tags', [])]
-            
-            Clock.schedule_once(lambda dt: self.atualizar_lista(filtrados), 0)
+            filtrados = self.filtrar_por_tags(selecionadas)
+            Clock.schedule_once(partial(self.mostrar_filtro, geracao, selecionadas, filtrados), 0)
         
         threading.Thread(target=thread_de_processamento, daemon=True).start()
     
+    def mostrar_filtro(self, geracao, selecionadas, filtrados, dt):
+        if not self.search_session.is_current(geracao):
+            return
+        
+        if selecionadas:
+            self.atualizar_lista(filtrados)
+        else:
+            self.mostrar_lista_completa(filtrados)
+    
+    def filtrar_por_tags(self, tags):
+        locais = [j for j in self.banco_de_jogos if all(t in j.get('tags', []) for t in tags)]
+        return locais + db.filter_games(tags)
+    
     def draw_winlator_icon(self, instance):
         instance.canvas.clear()
         bx, by = instance.x, instance.y + 10
@@ -2704,42 +5072,50 @@ class MainScreen(Screen):
         elif acao == 'make_admin':
             self.show_make_admin_popup()
         elif acao == 'refresh':
-            self.refresh_games_list()
+            self.refresh_games_list(force=True)
             self.show_message_popup("Atualizado", "Lista de jogos atualizada do Firebase!")
         else:
+            geracao = self.search_session.invalidate()
+            
             def thread_opcao():
-                global_games = db.get_global_games()
-                todos_jogos = self.banco_de_jogos + global_games
-                
-                if acao == 'home':
-                    lista = todos_jogos
-                    titulo = "WINLATOR HUB"
-                    cor = COR_TEXTO_ROXO
-                elif acao == 'top':
-                    lista = [jogo for jogo in todos_jogos if 'top' in jogo.get('tags', [])]
+                if acao == 'top':
+                    lista = self.filtrar_por_tags(['top'])
                     titulo = "TOP GAMES"
                     cor = (1, 0.8, 0, 1)
                 elif acao == 'novo':
-                    lista = [jogo for jogo in todos_jogos if 'novo' in jogo.get('tags', [])]
+                    lista = self.filtrar_por_tags(['novo'])
                     titulo = "ATUALIZACOES"
                     cor = (0, 0.8, 1, 1)
                 else:
-                    lista = todos_jogos
+                    lista = self.filtrar_por_tags([])
                     titulo = "WINLATOR HUB"
                     cor = COR_TEXTO_ROXO
                 
                 def update_ui(dt):
+                    if not self.search_session.is_current(geracao):
+                        return
                     self.lbl_main.text = titulo
                     self.lbl_main.color = cor
-                    self.atualizar_lista(lista)
+                    if acao == 'top' or acao == 'novo':
+                        self.atualizar_lista(lista)
+                    else:
+                        self.mostrar_lista_completa(lista)
                 
                 Clock.schedule_once(update_ui, 0)
             
             threading.Thread(target=thread_opcao, daemon=True).start()
     
-    def atualizar_lista(self, lista_de_jogos):
+    def mostrar_lista_completa(self, lista_de_jogos):
+        self.lista_atual = lista_de_jogos
+        self.atualizar_lista(lista_de_jogos)
+    
+    def atualizar_lista(self, lista_de_jogos, agrupar=True):
         self.list_layout.clear_widgets()
         self.letra_separadora_atual = ""
+        self.agrupar_por_letra = agrupar
+        self.cards_por_nome = {}
+        self.widgets_por_nome = {}
+        self.lista_exibida = lista_de_jogos
         
         if not lista_de_jogos:
             empty_label = Label(text='Nenhum jogo encontrado.', font_size=16, size_hint_y=None, height=150)
@@ -2748,6 +5124,7 @@ class MainScreen(Screen):
         
         self.jogos_pendentes = lista_de_jogos[5:]
         self.renderizar_jogos(lista_de_jogos[:5])
+        self.agendar_prefetch()
         
         if self.jogos_pendentes:
             Clock.schedule_once(self.carregar_proximo_lote, 0.05)
@@ -2760,31 +5137,129 @@ class MainScreen(Screen):
         self.renderizar_jogos(lote)
         if self.jogos_pendentes:
             Clock.schedule_once(self.carregar_proximo_lote, 0.05)
+        else:
+            self.agendar_prefetch()
+    
+    def agendar_prefetch(self, *args):
+        if self._prefetch_event:
+            self._prefetch_event.cancel()
+        self._prefetch_event = Clock.schedule_once(self.prefetch_visiveis, PREFETCH_DELAY)
+    
+    def prefetch_visiveis(self, dt):
+        layout = self.list_layout
+        janela = self.scroll.height
+        topo = max(layout.height - janela, 0) * self.scroll.scroll_y + janela
+        base = topo - janela
+        margem = janela * PREFETCH_MARGIN
+        centro = (topo + base) / 2
+        
+        candidatos = []
+        for widget in layout.children:
+            dados = getattr(widget, 'game_data', None)
+            if dados is None:
+                continue
+            y = widget.y - layout.y
+            if y + widget.height >= base - margem and y <= topo + margem:
+                candidatos.append((abs(y + widget.height / 2 - centro), dados))
+        
+        jogos = [dados for _, dados in sorted(candidatos, key=lambda c: c[0])]
+        self.prefetcher.prefetch(jogos)
+        for jogo in jogos:
+            self.prefetcher.warm_image(jogo.get('image', ''))
     
     def renderizar_jogos(self, lista_de_jogos):
+        if not self.agrupar_por_letra:
+            for jogo in lista_de_jogos:
+                self.list_layout.add_widget(self.criar_card(jogo))
+            return
+        
         jogos_ordenados = sorted(lista_de_jogos, key=lambda x: x['nome'].upper())
         
         for jogo in jogos_ordenados:
-            primeira_letra = jogo['nome'][0].upper()
-            if not primeira_letra.isalpha():
-                primeira_letra = '#'
+            primeira_letra = self.letra_do_jogo(jogo['nome'])
             
             if primeira_letra != self.letra_separadora_atual:
                 self.letra_separadora_atual = primeira_letra
                 header = AlphabetHeader(letter=self.letra_separadora_atual)
                 self.list_layout.add_widget(header)
             
-            if self.is_admin:
-                card = AdminGameCardWithImage(
-                    game_data=jogo,
-                    on_open=self.abrir_detalhes,
-                    on_delete=self.delete_admin_game,
-                    comments_count=0
-                )
-            else:
-                card = GameCardWithImage(game_data=jogo, on_click=self.abrir_detalhes)
-            
-            self.list_layout.add_widget(card)
+            self.list_layout.add_widget(self.criar_card(jogo))
+    
+    def letra_do_jogo(self, nome):
+        primeira_letra = nome[0].upper()
+        if not primeira_letra.isalpha():
+            primeira_letra = '#'
+        return primeira_letra
+    
+    def criar_card(self, jogo):
+        comments_count = self.comments_counts.get(jogo['nome'], 0)
+        if self.is_admin:
+            card = AdminGameCardWithImage(
+                game_data=jogo,
+                on_open=self.abrir_detalhes,
+                on_delete=self.delete_admin_game,
+                comments_count=comments_count
+            )
+            self.cards_por_nome[jogo['nome']] = card.game_card
+        else:
+            card = GameCardWithImage(game_data=jogo, on_click=self.abrir_detalhes, comments_count=comments_count)
+            self.cards_por_nome[jogo['nome']] = card
+        
+        self.widgets_por_nome[jogo['nome']] = card
+        return card
+    
+    def inserir_card(self, jogo):
+        if self.jogos_pendentes:
+            self.jogos_pendentes.append(jogo)
+            return
+        
+        widgets = list(reversed(self.list_layout.children))
+        chave = jogo['nome'].upper()
+        letra = self.letra_do_jogo(jogo['nome'])
+        
+        posicao = len(widgets)
+        for i, widget in enumerate(widgets):
+            dados = getattr(widget, 'game_data', None)
+            if dados is not None and dados['nome'].upper() > chave:
+                posicao = i
+                break
+        
+        while posicao > 0 and isinstance(widgets[posicao - 1], AlphabetHeader) and widgets[posicao - 1].letter_label.text != letra:
+            posicao -= 1
+        
+        anterior = widgets[posicao - 1] if posicao > 0 else None
+        if isinstance(anterior, AlphabetHeader):
+            precisa_header = anterior.letter_label.text != letra
+        elif anterior is not None:
+            precisa_header = self.letra_do_jogo(anterior.game_data['nome']) != letra
+        else:
+            precisa_header = True
+        
+        indice = len(widgets) - posicao
+        if precisa_header:
+            self.list_layout.add_widget(AlphabetHeader(letter=letra), index=indice)
+        self.list_layout.add_widget(self.criar_card(jogo), index=indice)
+    
+    def remover_card(self, nome):
+        widget = self.widgets_por_nome.pop(nome, None)
+        self.cards_por_nome.pop(nome, None)
+        if widget is None:
+            return
+        
+        widgets = list(reversed(self.list_layout.children))
+        posicao = widgets.index(widget)
+        anterior = widgets[posicao - 1] if posicao > 0 else None
+        seguinte = widgets[posicao + 1] if posicao + 1 < len(widgets) else None
+        self.list_layout.remove_widget(widget)
+        
+        if isinstance(anterior, AlphabetHeader) and (seguinte is None or isinstance(seguinte, AlphabetHeader)):
+            self.list_layout.remove_widget(anterior)
+    
+    def substituir_card(self, jogo):
+        antigo = self.widgets_por_nome.get(jogo['nome'])
+        indice = self.list_layout.children.index(antigo)
+        self.list_layout.remove_widget(antigo)
+        self.list_layout.add_widget(self.criar_card(jogo), index=indice)
     
     def abrir_detalhes(self, dados_jogo):
         self.jogos_pendentes = []
@@ -2797,21 +5272,63 @@ class MainScreen(Screen):
         except Exception as e:
             print(f"Erro ao abrir detalhes: {e}")
     
+    def mostrar_sugestoes(self, valor):
+        self.suggestions_box.clear_widgets()
+        sugestoes = db.suggest_games(valor) if valor.strip() else []
+        if len(sugestoes) == 1 and sugestoes[0].casefold() == valor.strip().casefold():
+            sugestoes = []
+        
+        for nome in sugestoes:
+            btn = Button(
+                text=nome,
+                size_hint_y=None,
+                height=48,
+                background_normal='',
+                background_color=(0, 0, 0, 0),
+                color=(0.85, 0.85, 0.9, 1),
+                font_size=17,
+                font_name='Roboto',
+                halign='left',
+                valign='middle',
+                shorten=True
+            )
+            btn.bind(size=lambda instance, val: setattr(instance, 'text_size', (instance.width, None)))
+            btn.bind(on_release=lambda x, n=nome: self.escolher_sugestao(n))
+            self.suggestions_box.add_widget(btn)
+        
+        self.suggestions_box.height = 48 * len(sugestoes)
+        self.suggestions_box.opacity = 1 if sugestoes else 0
+    
+    def escolher_sugestao(self, nome):
+        self.search_input.text = nome
+        self.mostrar_sugestoes("")
+    
     def filtrar_jogos(self, instance, valor):
+        self.mostrar_sugestoes(valor)
         if self._search_event:
             self._search_event.cancel()
         self._search_event = Clock.schedule_once(lambda dt: self.executar_busca(valor), 0.5)
     
     def executar_busca(self, valor):
-        busca = valor.lower().strip()
+        self.search_session.submit(valor.lower().strip(), self.receber_busca)
+    
+    def receber_busca(self, geracao, busca, jogos, erro):
+        Clock.schedule_once(partial(self.mostrar_busca, geracao, busca, jogos, erro), 0)
+    
+    def mostrar_busca(self, geracao, busca, jogos, erro, dt):
+        if not self.search_session.is_current(geracao):
+            return
         
-        def thread_busca():
-            global_games = db.get_global_games()
-            todos_jogos = self.banco_de_jogos + global_games
-            filtrados = [j for j in todos_jogos if busca in j['nome'].lower()]
-            Clock.schedule_once(lambda dt: self.atualizar_lista(filtrados), 0)
+        if erro is not None:
+            self.show_message_popup("Erro", f"Erro na busca: {erro}")
+            return
+        
+        if not busca:
+            self.mostrar_lista_completa(self.banco_de_jogos + jogos)
+            return
         
-        threading.Thread(target=thread_busca, daemon=True).start()
+        locais = [j for j in self.banco_de_jogos if busca in j['nome'].lower()]
+        self.atualizar_lista(locais + jogos, agrupar=False)
 
 
 class CreditsScreen(Screen):
@@ -2874,7 +5391,13 @@ class WinlatorApp(App):
         sm.add_widget(MainScreen(name='main'))
         sm.add_widget(GameDetailsScreen(name='details'))
         sm.add_widget(CreditsScreen(name='credits'))
+        if LIVE_SYNC_ENABLED:
+            catalog_sync.start()
         return sm
+    
+    def on_stop(self):
+        catalog_sync.stop()
+        db.close()
 
 
 if __name__ == '__main__':
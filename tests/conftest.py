@@ -0,0 +1,75 @@
+import importlib.util
+import os
+import queue
+import shutil
+import sys
+import time
+
+import pytest
+
+from firebase_stub import FirebaseStub
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def main_module(tmp_path):
+    pytest.importorskip("kivy")
+    shutil.copy(os.path.join(ROOT, "main.py"), tmp_path / "main.py")
+    spec = importlib.util.spec_from_file_location("main", tmp_path / "main.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["main"] = module
+    spec.loader.exec_module(module)
+    yield module
+    module.db.close()
+    sys.modules.pop("main", None)
+
+
+@pytest.fixture
+def firebase(main_module):
+    stub = FirebaseStub().start()
+    main_module.FIREBASE_URL = stub.url
+    yield stub
+    stub.stop()
+
+
+class ManualEvent:
+    def __init__(self, callback):
+        self.callback = callback
+        self.cancelled = False
+    
+    def cancel(self):
+        self.cancelled = True
+
+
+class ManualClock:
+    def __init__(self):
+        self.events = queue.Queue()
+    
+    def schedule_once(self, callback, timeout=0):
+        event = ManualEvent(callback)
+        self.events.put(event)
+        return event
+    
+    def run_until(self, condition, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            try:
+                event = self.events.get(timeout=0.02)
+            except queue.Empty:
+                continue
+            if not event.cancelled:
+                event.callback(0)
+        return True
+
+
+@pytest.fixture
+def clock(main_module, monkeypatch):
+    manual = ManualClock()
+    monkeypatch.setattr(main_module, "Clock", manual)
+    return manual
@@ -0,0 +1,249 @@
+import hashlib
+import json
+import queue
+import threading
+import time
+import urllib.parse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+class FirebaseStub:
+    def __init__(self):
+        self.root = {}
+        self.requests = []
+        self.lock = threading.RLock()
+        self.stream_connections = 0
+        self._streams = []
+        self._server = None
+    
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}/"
+    
+    def start(self):
+        handler = type('Handler', (FirebaseHandler,), {'stub': self})
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+    
+    def stop(self):
+        self.disconnect_streams()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+    
+    def _parts(self, path):
+        return [p for p in path.strip('/').split('/') if p]
+    
+    def get(self, path):
+        node = self.root
+        for part in self._parts(path):
+            if isinstance(node, list) and part.isdigit() and int(part) < len(node):
+                node = node[int(part)]
+            elif isinstance(node, dict) and part in node:
+                node = node[part]
+            else:
+                return None
+        return node
+    
+    def _resolve(self, path, value):
+        if isinstance(value, dict):
+            if '.sv' in value:
+                current = self.get(path)
+                return (current if isinstance(current, (int, float)) else 0) + value['.sv']['increment']
+            return {k: self._resolve(f"{path}/{k}", v) for k, v in value.items()}
+        return value
+    
+    def _prune(self, node):
+        if isinstance(node, dict):
+            for key in list(node):
+                self._prune(node[key])
+                if node[key] is None or node[key] == {}:
+                    del node[key]
+    
+    def set(self, path, value):
+        with self.lock:
+            value = self._resolve(path, value)
+            parts = self._parts(path)
+            if not parts:
+                self.root = value if isinstance(value, dict) else {}
+            else:
+                node = self.root
+                for part in parts[:-1]:
+                    if not isinstance(node.get(part), dict):
+                        node[part] = {}
+                    node = node[part]
+                node[parts[-1]] = value
+            self._prune(self.root)
+            self._notify('put', path, value)
+    
+    def update(self, path, values):
+        with self.lock:
+            for key, value in values.items():
+                parts = self._parts(f"{path}/{key}")
+                value = self._resolve("/".join(parts), value)
+                node = self.root
+                for part in parts[:-1]:
+                    if not isinstance(node.get(part), dict):
+                        node[part] = {}
+                    node = node[part]
+                node[parts[-1]] = value
+            self._prune(self.root)
+            self._notify('patch', path, values)
+    
+    def _notify(self, event, path, data):
+        path = '/' + path.strip('/')
+        for events, base in list(self._streams):
+            if path == base or path.startswith(base.rstrip('/') + '/'):
+                events.put((event, '/' + path[len(base):].strip('/'), data))
+    
+    def open_stream(self, path):
+        events = queue.Queue()
+        with self.lock:
+            self.stream_connections += 1
+            self._streams.append((events, '/' + path.strip('/')))
+            events.put(('put', '/', self.query(path, {})))
+        return events
+    
+    def close_stream(self, events):
+        with self.lock:
+            self._streams = [s for s in self._streams if s[0] is not events]
+    
+    def push(self, event, path, data):
+        with self.lock:
+            self._notify(event, path, data)
+    
+    def disconnect_streams(self):
+        with self.lock:
+            for events, _ in self._streams:
+                events.put(None)
+            self._streams = []
+    
+    def query(self, path, params):
+        with self.lock:
+            value = self.get(path)
+            if 'shallow' in params and isinstance(value, dict):
+                value = {k: True for k in value}
+            if 'orderBy' in params and isinstance(value, list):
+                value = {str(i): v for i, v in enumerate(value) if v is not None}
+            if 'orderBy' in params and isinstance(value, dict):
+                order = lambda k: (0, int(k), '') if k.isdigit() else (1, 0, k)
+                keys = sorted(value, key=order)
+                if 'endAt' in params:
+                    end = json.loads(params['endAt'][0])
+                    keys = [k for k in keys if order(k) <= order(end)]
+                if 'limitToLast' in params:
+                    keys = keys[-int(params['limitToLast'][0]):]
+                if 'limitToFirst' in params:
+                    keys = keys[:int(params['limitToFirst'][0])]
+                value = {k: value[k] for k in keys}
+            return json.loads(json.dumps(value))
+    
+    @staticmethod
+    def etag(value):
+        return hashlib.md5(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class FirebaseHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    stub = None
+    
+    def log_message(self, *args):
+        pass
+    
+    def _target(self):
+        url = urllib.parse.urlparse(self.path)
+        path = url.path[:-5] if url.path.endswith('.json') else url.path
+        return path, urllib.parse.parse_qs(url.query)
+    
+    def _body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'null')
+    
+    def _log(self, status, body=None):
+        self.stub.requests.append({
+            "method": self.command,
+            "path": self.path,
+            "headers": dict(self.headers),
+            "body": body,
+            "status": status
+        })
+    
+    def _send(self, status, body, headers=None):
+        data = json.dumps(body).encode('utf-8') if status != 304 else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def _stream(self, path):
+        events = self.stub.open_stream(path)
+        self._log(200)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+        try:
+            while True:
+                try:
+                    item = events.get(timeout=1)
+                except queue.Empty:
+                    item = ('keep-alive', None, None)
+                if item is None:
+                    return
+                event, event_path, data = item
+                payload = json.dumps({"path": event_path, "data": data}) if event_path is not None else "null"
+                self.wfile.write(f"event: {event}\ndata: {payload}\n\n".encode('utf-8'))
+                self.wfile.flush()
+        except OSError:
+            pass
+        finally:
+            self.stub.close_stream(events)
+    
+    def do_GET(self):
+        path, params = self._target()
+        if self.headers.get('Accept') == 'text/event-stream':
+            return self._stream(path)
+        value = self.stub.query(path, params)
+        headers = {}
+        status = 200
+        if self.headers.get('X-Firebase-ETag') == 'true':
+            headers['ETag'] = self.stub.etag(value)
+            if self.headers.get('if-none-match') == headers['ETag']:
+                status = 304
+        self._log(status)
+        self._send(status, value, headers)
+    
+    def do_PUT(self):
+        path, _ = self._target()
+        body = self._body()
+        self.stub.set(path, body)
+        self._log(200, body)
+        self._send(200, body)
+    
+    def do_PATCH(self):
+        path, _ = self._target()
+        body = self._body()
+        self.stub.update(path, body)
+        self._log(200, body)
+        self._send(200, body)
+    
+    def do_POST(self):
+        path, _ = self._target()
+        body = self._body()
+        name = '-N%013d' % int(time.time() * 1000)
+        self.stub.set(f"{path}/{name}", body)
+        self._log(200, body)
+        self._send(200, {"name": name})
+    
+    def do_DELETE(self):
+        path, _ = self._target()
+        self.stub.set(path, None)
+        self._log(200)
+        self._send(200, None)
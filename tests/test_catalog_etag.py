@@ -0,0 +1,43 @@
+def catalog_requests(firebase):
+    return [r for r in firebase.requests if r["method"] == "GET" and r["path"].startswith("/games.json")]
+
+
+def test_unchanged_catalog_is_answered_with_304(main_module, firebase):
+    firebase.root = {"games": {"g1": {"nome": "Game 1"}, "g2": {"nome": "Game 2"}}}
+    db = main_module.db
+    
+    first = db.get_global_games(force=True)
+    second = db.get_global_games(force=True)
+    
+    requests = catalog_requests(firebase)
+    assert [r["status"] for r in requests] == [200, 304]
+    assert requests[0]["headers"].get("X-Firebase-ETag") == "true"
+    assert requests[1]["headers"].get("if-none-match") == firebase.etag(firebase.root["games"])
+    assert sorted(g["nome"] for g in second) == sorted(g["nome"] for g in first) == ["Game 1", "Game 2"]
+
+
+def test_changed_catalog_is_downloaded_again(main_module, firebase):
+    firebase.root = {"games": {"g1": {"nome": "Game 1"}}}
+    db = main_module.db
+    db.get_global_games(force=True)
+    
+    firebase.set("games/g2", {"nome": "Game 2"})
+    games = db.get_global_games(force=True)
+    
+    assert [r["status"] for r in catalog_requests(firebase)] == [200, 200]
+    assert sorted(g["nome"] for g in games) == ["Game 1", "Game 2"]
+
+
+def test_etag_survives_a_restart(main_module, firebase):
+    firebase.root = {"games": {"g1": {"nome": "Game 1"}}}
+    main_module.db.get_global_games(force=True)
+    main_module.db.writer.flush()
+    
+    restarted = main_module.Database()
+    try:
+        games = restarted.get_global_games(force=True)
+    finally:
+        restarted.close()
+    
+    assert catalog_requests(firebase)[-1]["status"] == 304
+    assert [g["nome"] for g in games] == ["Game 1"]
@@ -0,0 +1,32 @@
+import threading
+
+
+def test_index_is_built_on_the_writer_and_readable_before_the_flush(main_module, monkeypatch):
+    db = main_module.db
+    builds = []
+    build = main_module.CatalogIndex.build
+    monkeypatch.setattr(main_module.CatalogIndex, "build", staticmethod(
+        lambda entries: builds.append(threading.current_thread()) or build(entries)
+    ))
+    catalog = {
+        "zelda": {"nome": "Zelda"},
+        "ação_total": {"nome": "Ação Total"},
+        "age_of_empires": {"nome": "Age of Empires"}
+    }
+    
+    db._save_cache(catalog, version=1)
+    db._save_cache(dict(catalog, asterix={"nome": "Asterix"}), version=2)
+    assert builds == []
+    
+    index = db.get_catalog_index()
+    assert [g["nome"] for g in index.prefix("a")] == ["Ação Total", "Age of Empires", "Asterix"]
+    assert len(builds) == 1
+    
+    db.writer.flush()
+    assert len(builds) == 1
+    
+    db._catalog_index = None
+    index = db.get_catalog_index()
+    assert index._handle is not None
+    assert [g["nome"] for g in index.games()] == ["Ação Total", "Age of Empires", "Asterix", "Zelda"]
+    index.close()
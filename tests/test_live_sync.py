@@ -0,0 +1,108 @@
+import threading
+import time
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+class RecordingEvent(threading.Event):
+    def __init__(self, limit):
+        super().__init__()
+        self.waits = []
+        self.limit = limit
+    
+    def wait(self, timeout=None):
+        self.waits.append(timeout)
+        if len(self.waits) >= self.limit:
+            self.set()
+        return self.is_set()
+
+
+def test_apply_catalog_event_reports_fine_grained_changes(main_module):
+    db = main_module.db
+    game1 = {"nome": "Game 1"}
+    game2 = {"nome": "Game 2"}
+    
+    assert db.apply_catalog_event('put', '/', {"g1": game1}) == [('add', game1, None)]
+    version = db._catalog_version
+    
+    assert db.apply_catalog_event('put', '/g2', game2) == [('add', game2, None)]
+    assert db.apply_catalog_event('patch', '/g1', {"link": "http://x"}) == [
+        ('update', {"nome": "Game 1", "link": "http://x"}, game1)
+    ]
+    assert db.apply_catalog_event('put', '/g2', None) == [('remove', None, game2)]
+    assert db.apply_catalog_event('put', '/g1/link', "http://x") == []
+    assert db._catalog_version > version
+    
+    db.writer.flush()
+    assert db._get_cached_catalog() == {"g1": {"nome": "Game 1", "link": "http://x"}}
+
+
+def test_catalog_sync_applies_streamed_events(main_module, firebase):
+    firebase.root = {"games": {"game_1": {"nome": "Game 1"}}}
+    db = main_module.db
+    events = []
+    sync = main_module.CatalogSync(db)
+    sync.add_listener(lambda kind, game, old_game: events.append((kind, game, old_game)))
+    sync.start()
+    try:
+        assert wait_for(lambda: db.get_catalog_game("Game 1") is not None)
+        
+        firebase.set("games/game_2", {"nome": "Game 2"})
+        assert wait_for(lambda: ('add', {"nome": "Game 2"}, None) in events)
+        
+        firebase.update("games/game_1", {"link": "http://x"})
+        assert wait_for(lambda: db.get_catalog_game("Game 1") == {"nome": "Game 1", "link": "http://x"})
+    finally:
+        sync.stop()
+
+
+def test_catalog_sync_reconnects_after_the_stream_drops(main_module, firebase):
+    firebase.root = {"games": {"game_1": {"nome": "Game 1"}}}
+    db = main_module.db
+    sync = main_module.CatalogSync(db)
+    sync.start()
+    try:
+        assert wait_for(lambda: sync.connected)
+        
+        firebase.disconnect_streams()
+        assert wait_for(lambda: firebase.stream_connections == 2)
+        
+        firebase.set("games/game_3", {"nome": "Game 3"})
+        assert wait_for(lambda: db.get_catalog_game("Game 3") is not None)
+    finally:
+        sync.stop()
+
+
+def test_catalog_sync_backs_off_exponentially_up_to_the_limit(main_module):
+    main_module.FIREBASE_URL = "http://127.0.0.1:9/"
+    sync = main_module.CatalogSync(main_module.db, max_backoff=4)
+    sync._stop_event = RecordingEvent(5)
+    
+    sync._run()
+    
+    assert sync._stop_event.waits == [1, 2, 4, 4, 4]
+
+
+def test_streamed_events_are_persisted_with_one_encode(main_module, monkeypatch):
+    db = main_module.db
+    db.apply_catalog_event('put', '/', {f"game_{i}": {"nome": f"Game {i}"} for i in range(100)})
+    db.writer.flush()
+    
+    encoded = []
+    encode = db._encode_catalog
+    monkeypatch.setattr(db, "_encode_catalog", lambda *args: encoded.append(threading.current_thread()) or encode(*args))
+    for i in range(20):
+        db.apply_catalog_event('patch', f'/game_{i}', {"link": f"http://x/{i}"})
+    assert encoded == []
+    
+    db.writer.flush()
+    assert len(encoded) == 1
+    assert encoded[0] is not threading.current_thread()
+    assert db._get_cached_catalog()["game_19"] == {"nome": "Game 19", "link": "http://x/19"}
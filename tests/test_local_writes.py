@@ -0,0 +1,27 @@
+def test_local_write_on_a_cached_snapshot_keeps_it_stale(main_module, firebase):
+    game1 = {"nome": "Game 1", "link": "http://x"}
+    game2 = {"nome": "Game 2", "link": "http://y"}
+    game3 = {"nome": "Game 3", "link": "http://z"}
+    firebase.root = {"games": {"game_1": game1, "game_2": game2, "game_3": game3}}
+    db = main_module.db
+    db._save_cache({"game_1": game1}, version=1)
+    db.writer.flush()
+    
+    db._apply_local_write("game_3", game3)
+    
+    assert db.get_catalog_game("Game 3") == game3
+    assert db._get_fresh_catalog() is None
+    assert sorted(g["nome"] for g in db.get_global_games()) == ["Game 1", "Game 2", "Game 3"]
+    assert db._get_fresh_catalog() is not None
+
+
+def test_local_write_keeps_the_server_timestamp(main_module, firebase):
+    firebase.root = {"games": {"game_1": {"nome": "Game 1"}}}
+    db = main_module.db
+    db.get_global_games(force=True)
+    fetched_at = db._catalog_time
+    
+    db._apply_local_write("game_2", {"nome": "Game 2"})
+    
+    assert db._catalog_time == fetched_at
+    assert db.get_catalog_game("Game 2") == {"nome": "Game 2"}
@@ -0,0 +1,72 @@
+import threading
+
+
+def test_cold_start_paints_the_catalog_once_it_is_revalidated(main_module, firebase, clock):
+    firebase.root = {"games": {
+        "game_1": {"nome": "Game 1", "link": "http://x"},
+        "game_2": {"nome": "Game 2", "link": "http://y"}
+    }}
+    screen = main_module.MainScreen(name='main')
+    
+    screen.refresh_games_list()
+    assert screen.is_loading
+    assert clock.run_until(lambda: not screen.is_loading)
+    assert clock.run_until(lambda: not screen.jogos_pendentes)
+    
+    assert sorted(screen.cards_por_nome) == ["Game 1", "Game 2"]
+    assert screen.loading_label.opacity == 0
+    assert screen.lista_exibida is screen.lista_atual
+    
+    screen.refresh_games_list(force=True)
+    assert screen.is_loading
+    assert clock.run_until(lambda: not screen.is_loading)
+
+
+def test_cold_start_offline_stops_loading(main_module, clock):
+    main_module.FIREBASE_URL = "http://127.0.0.1:9/"
+    screen = main_module.MainScreen(name='main')
+    
+    screen.refresh_games_list()
+    assert clock.run_until(lambda: not screen.is_loading)
+    
+    assert screen.cards_por_nome == {}
+    assert screen.loading_label.opacity == 0
+
+
+def test_revalidation_keeps_a_filtered_view(main_module, clock):
+    games = [{"nome": "Game 1", "link": ""}, {"nome": "Game 2", "link": "", "tags": ["RPG"]}]
+    screen = main_module.MainScreen(name='main')
+    screen.update_games_ui(games)
+    screen.atualizar_lista([games[1]])
+    
+    screen.aplicar_catalogo_revalidado(games + [{"nome": "Game 3", "link": ""}])
+    
+    assert list(screen.cards_por_nome) == ["Game 2"]
+    assert [g["nome"] for g in screen.lista_atual] == ["Game 1", "Game 2", "Game 3"]
+
+
+def test_a_slow_category_filter_does_not_overwrite_a_newer_selection(main_module, clock, monkeypatch):
+    games = [
+        {"nome": "Game 1", "link": "", "tags": ["RPG"]},
+        {"nome": "Game 2", "link": "", "tags": ["RPG", "Terror"]}
+    ]
+    screen = main_module.MainScreen(name='main')
+    screen.update_games_ui(games)
+    release = threading.Event()
+    filtrar = screen.filtrar_por_tags
+    
+    def slow_first(tags):
+        if tags == ["RPG"]:
+            release.wait(5)
+        return filtrar(tags)
+    
+    monkeypatch.setattr(main_module.db, "filter_games", lambda tags: [g for g in games if all(t in g["tags"] for t in tags)])
+    monkeypatch.setattr(screen, "filtrar_por_tags", slow_first)
+    
+    screen.filtrar_por_categoria("RPG", None)
+    screen.filtrar_por_categoria("Terror", None)
+    assert clock.run_until(lambda: list(screen.cards_por_nome) == ["Game 2"])
+    
+    release.set()
+    clock.run_until(lambda: False, timeout=0.5)
+    assert list(screen.cards_por_nome) == ["Game 2"]
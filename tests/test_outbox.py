@@ -0,0 +1,94 @@
+import time
+
+OFFLINE_URL = "http://127.0.0.1:9/"
+
+EXISTING = {
+    "-Aexisting": {
+        "user": "carla",
+        "text": "primeiro",
+        "date": "01/01/2024 12:00",
+        "replies": {"-Areply": {"user": "dani", "text": "resposta", "date": "01/01/2024 12:05"}}
+    }
+}
+
+
+def go_online(main_module, firebase):
+    main_module.FIREBASE_URL = firebase.url
+    main_module.db.circuit.record_success()
+
+
+def replay_requests(firebase, start):
+    return [(r["method"], r["path"].split("?")[0]) for r in firebase.requests[start:]]
+
+
+def test_offline_comments_are_replayed_once(main_module, firebase):
+    firebase.root = {"games": {"game_1": {"nome": "Game 1"}}}
+    db = main_module.db
+    main_module.FIREBASE_URL = OFFLINE_URL
+    
+    assert db.add_comment("Game 1", "ana", "oi")[0]
+    comment_id = db._load_outbox()[0]["comment_id"]
+    assert db.add_reply("Game 1", comment_id, "bia", "ola")[0]
+    ops = db._load_outbox()
+    assert [op["kind"] for op in ops] == ["add_comment", "add_reply"]
+    
+    go_online(main_module, firebase)
+    start = len(firebase.requests)
+    assert db.replay_outbox() == (2, 2)
+    
+    assert replay_requests(firebase, start) == [("GET", "/comments/game_1.json"), ("PATCH", "/.json")]
+    comment = firebase.get(f"comments/game_1/{comment_id}")
+    assert comment["text"] == "oi"
+    assert [r["text"] for r in comment["replies"].values()] == ["ola"]
+    assert firebase.get("comment_stats/game_1") == {"comments": 1, "replies": 1}
+    assert db._load_outbox() == []
+    
+    db._save_outbox(ops)
+    assert db.replay_outbox() == (2, 2)
+    assert firebase.get("comment_stats/game_1") == {"comments": 1, "replies": 1}
+    assert len(firebase.get("comments/game_1")) == 1
+    assert db._load_outbox() == []
+
+
+def test_offline_delete_is_replayed_once(main_module, firebase):
+    firebase.root = {
+        "games": {"game_1": {"nome": "Game 1"}},
+        "comments": {"game_1": dict(EXISTING)},
+        "comment_stats": {"game_1": {"comments": 1, "replies": 1}}
+    }
+    db = main_module.db
+    main_module.FIREBASE_URL = OFFLINE_URL
+    
+    assert db.delete_comment("Game 1", "-Aexisting")
+    ops = db._load_outbox()
+    
+    go_online(main_module, firebase)
+    assert db.replay_outbox() == (1, 1)
+    assert firebase.get("comments/game_1") is None
+    assert firebase.get("comment_stats/game_1") == {"comments": 0, "replies": 0}
+    
+    db._save_outbox(ops)
+    assert db.replay_outbox() == (1, 1)
+    assert firebase.get("comment_stats/game_1") == {"comments": 0, "replies": 0}
+
+
+def test_pending_comments_are_merged_into_pages(main_module, firebase):
+    firebase.root = {
+        "games": {"game_1": {"nome": "Game 1"}},
+        "comments": {"game_1": dict(EXISTING)}
+    }
+    db = main_module.db
+    main_module.FIREBASE_URL = OFFLINE_URL
+    
+    assert db.add_comment("Game 1", "ana", "pendente")[0]
+    comments, _ = db.get_comments_page("Game 1")
+    assert [c["text"] for c in comments] == ["pendente"]
+    
+    go_online(main_module, firebase)
+    db._next_replay_at = time.monotonic() + 3600
+    db.comment_cache.invalidate("game_1")
+    comments, _ = db.get_comments_page("Game 1")
+    
+    assert sorted(c["text"] for c in comments) == ["pendente", "primeiro"]
+    assert len(db._load_outbox()) == 1
+    assert firebase.get("comments/game_1") == EXISTING
@@ -0,0 +1,33 @@
+class LoaderRecorder:
+    def __init__(self):
+        self.urls = []
+    
+    def image(self, url):
+        self.urls.append(url)
+
+
+def test_warm_image_keeps_a_bounded_lru_of_prefetched_urls(main_module, monkeypatch):
+    loader = LoaderRecorder()
+    monkeypatch.setattr(main_module, "Loader", loader)
+    prefetcher = main_module.DetailsPrefetcher(None, max_images=3)
+    urls = [f"https://example.com/capa/{i}.jpg" for i in range(5)]
+    
+    for url in urls:
+        prefetcher.warm_image(url)
+    prefetcher.warm_image(urls[4])
+    prefetcher.warm_image(urls[0])
+    
+    assert len(prefetcher._images) == 3
+    assert loader.urls == urls + [urls[0]]
+
+
+def test_warm_image_loads_again_after_the_loader_cache_expires(main_module, monkeypatch):
+    loader = LoaderRecorder()
+    monkeypatch.setattr(main_module, "Loader", loader)
+    prefetcher = main_module.DetailsPrefetcher(None, image_ttl=0)
+    
+    prefetcher.warm_image("https://example.com/capa.jpg")
+    prefetcher.warm_image("https://example.com/capa.jpg")
+    prefetcher.warm_image("")
+    
+    assert loader.urls == ["https://example.com/capa.jpg"] * 2
@@ -0,0 +1,49 @@
+def build_index(main_module, games):
+    index = main_module.SearchIndex()
+    index.sync({f"game_{i}": game for i, game in enumerate(games)}, 1)
+    return index
+
+
+def names(games):
+    return [g["nome"] for g in games]
+
+
+def test_accents_are_folded(main_module):
+    index = build_index(main_module, [
+        {"nome": "Ação Total", "tags": ["Ação"]},
+        {"nome": "Corrida Maluca", "tags": ["Corrida"]}
+    ])
+    
+    assert names(index.search("acao")) == ["Ação Total"]
+    assert names(index.search("AÇÃO")) == ["Ação Total"]
+
+
+def test_misspelled_titles_are_found(main_module):
+    index = build_index(main_module, [
+        {"nome": "The Elder Scrolls V Skyrim"},
+        {"nome": "GTA Vice City"},
+        {"nome": "Need for Speed"}
+    ])
+    
+    assert names(index.search("skyrm")) == ["The Elder Scrolls V Skyrim"]
+    assert names(index.search("gta vice citty")) == ["GTA Vice City"]
+
+
+def test_name_matches_outrank_tag_and_description_matches(main_module):
+    index = build_index(main_module, [
+        {"nome": "GTA Vice City", "tags": ["Ação", "Crime"], "desc": "Corra pela cidade de carro"},
+        {"nome": "C++ Simulator", "tags": ["Indie"]},
+        {"nome": "Racing Club", "tags": ["Corrida"]}
+    ])
+    
+    assert names(index.search("c++")) == ["C++ Simulator", "GTA Vice City", "Racing Club"]
+
+
+def test_popularity_breaks_ties_within_a_tier(main_module):
+    index = build_index(main_module, [
+        {"nome": "Dark Souls"},
+        {"nome": "Dark Forest"}
+    ])
+    popular = {"game_0": 1, "game_1": 50}
+    
+    assert names(index.search("dark", popularity=lambda game_id, game: popular[game_id])) == ["Dark Forest", "Dark Souls"]
@@ -0,0 +1,35 @@
+import random
+
+TAGS = ["RPG", "Terror", "Ação", "Corrida", "top", "novo"]
+
+
+def brute_force(catalog, tags):
+    return sorted(g["nome"] for g in catalog.values() if all(t in g.get("tags", []) for t in tags))
+
+
+def random_game(rng, i):
+    return {"nome": f"Game {i}", "tags": rng.sample(TAGS, rng.randint(0, 3))}
+
+
+def test_tag_index_matches_a_brute_force_filter_across_incremental_updates(main_module):
+    rng = random.Random(25)
+    index = main_module.TagIndex()
+    catalog = {f"game_{i}": random_game(rng, i) for i in range(300)}
+    next_id = 300
+    
+    for version in range(1, 60):
+        catalog = dict(catalog)
+        for _ in range(rng.choice([1, 3, 60])):
+            action = rng.random()
+            if action < 0.3:
+                catalog[f"game_{next_id}"] = random_game(rng, next_id)
+                next_id += 1
+            elif action < 0.6 and catalog:
+                del catalog[rng.choice(sorted(catalog))]
+            elif catalog:
+                game_id = rng.choice(sorted(catalog))
+                catalog[game_id] = dict(catalog[game_id], tags=rng.sample(TAGS, rng.randint(0, 3)))
+        
+        index.sync(catalog, version)
+        for tags in ([], ["RPG"], ["RPG", "Terror"], ["top", "novo", "Ação"], ["Inexistente"]):
+            assert sorted(g["nome"] for g in index.select(tags)) == brute_force(catalog, tags)
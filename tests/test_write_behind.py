@@ -0,0 +1,59 @@
+import threading
+
+
+def test_deferred_writes_are_coalesced_and_encoded_on_the_writer_thread(main_module, tmp_path):
+    writer = main_module.FileWriter(delay=0.05)
+    path = str(tmp_path / "payload.bin")
+    calls = []
+    
+    def produce(n):
+        calls.append((n, threading.current_thread()))
+        return b"v%d" % n
+    
+    for n in range(5):
+        writer.write_deferred(path, lambda n=n: produce(n))
+    assert calls == []
+    
+    writer.flush()
+    writer.stop()
+    
+    assert [n for n, _ in calls] == [4]
+    assert calls[0][1] is not threading.current_thread()
+    with open(path, 'rb') as f:
+        assert f.read() == b"v4"
+
+
+def test_reading_a_deferred_write_encodes_it_once(main_module, tmp_path):
+    writer = main_module.FileWriter(delay=60)
+    path = str(tmp_path / "payload.bin")
+    calls = []
+    
+    def produce():
+        calls.append(1)
+        return b"data"
+    
+    writer.write_deferred(path, produce)
+    assert writer.read_bytes(path) == b"data"
+    assert writer.read_bytes(path) == b"data"
+    writer.stop()
+    
+    assert len(calls) == 1
+    with open(path, 'rb') as f:
+        assert f.read() == b"data"
+
+
+def test_saving_the_catalog_cache_does_not_encode_on_the_caller(main_module, monkeypatch):
+    db = main_module.db
+    encoded = []
+    encode = db._encode_catalog
+    monkeypatch.setattr(db, "_encode_catalog", lambda *args: encoded.append(threading.current_thread()) or encode(*args))
+    catalog = {"game_1": {"nome": "Game 1", "tags": ["RPG"]}}
+    
+    db._save_cache(catalog, version=1)
+    db._save_cache(dict(catalog, game_2={"nome": "Game 2"}), version=2)
+    assert encoded == []
+    
+    db.writer.flush()
+    assert len(encoded) == 1
+    assert encoded[0] is not threading.current_thread()
+    assert sorted(db._get_cached_catalog()) == ["game_1", "game_2"]